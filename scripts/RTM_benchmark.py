@@ -0,0 +1,204 @@
+import sys
+import os
+import json
+import argparse
+import time
+import platform
+import warnings
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import numpy as np
+import torch
+
+from rtm_torch.rtm import RTM
+from rtm_torch.lut import LUT_DEFAULTS
+from rtm_torch.sampling import make_sampler
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+
+# Throughput (spectra/s) and peak memory of the torch RTM for every combination of leaf model, canopy model, sensor,
+# batch size, number of threads and mode ('forward' under no_grad, 'backward' = forward + backward).
+# The results are written as JSON and compared against a baseline of an earlier run; a combination counts as a
+# regression if it is slower or uses more memory than the baseline by more than --tolerance:
+#
+#   python scripts/RTM_benchmark.py --output bench.json --update_baseline    (store the baseline)
+#   python scripts/RTM_benchmark.py --output bench.json                      (compare, exit code 1 on regressions)
+
+rtm_paras = json.load(open(os.path.join(project_root, 'src', 'rtm_torch', 'rtm_paras.json')))
+device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+
+
+def reset_peak_memory():
+    # peak resident memory is reset through /proc (Linux); elsewhere ru_maxrss only grows
+    if device.type == 'cuda':
+        torch.cuda.reset_peak_memory_stats()
+    elif os.path.exists('/proc/self/clear_refs'):
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+
+
+def current_memory():
+    if device.type == 'cuda':
+        return torch.cuda.memory_allocated()
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) * 1024 for line in f if line.startswith('VmRSS'))
+
+
+def peak_memory():
+    if device.type == 'cuda':
+        return torch.cuda.max_memory_allocated()
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status') as f:
+            return next(int(line.split()[1]) * 1024 for line in f if line.startswith('VmHWM'))
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def make_paras(batch_size, seed, requires_grad):
+    sampled = {k: v.numpy() for k, v in make_sampler('uniform', rtm_paras, batch_size, seed=seed).sample().items()}
+    paras = {}
+    for para_name in InitModel(lop='prospectD').para_names:
+        value = sampled.get(para_name, np.full(batch_size, LUT_DEFAULTS[para_name]))
+        paras[para_name] = torch.tensor(value, dtype=torch.float32, device=device)
+        if requires_grad and para_name in rtm_paras:
+            paras[para_name].requires_grad_(True)
+    return paras
+
+
+def run_once(model, paras, mode):
+    if mode == 'forward':
+        with torch.no_grad():
+            model.run_model(paras)
+    else:
+        model.run_model(paras).sum().backward()
+    if device.type == 'cuda':
+        torch.cuda.synchronize()
+
+
+def benchmark(lop, canopy_arch, sensor, batch_size, threads, mode, repeats, min_seconds, max_memory, seed):
+    # runs in a fresh process, so that the peak memory belongs to this combination only
+    torch.set_num_threads(threads)
+    model = InitModel(lop=lop, canopy_arch=None if canopy_arch == 'None' else canopy_arch, nodat=-999,
+                      int_boost=1.0, s2s=sensor, max_memory=max_memory)
+    run_once(model, make_paras(2, seed, mode == 'backward'), mode)  # warm-up
+    paras = make_paras(batch_size, seed, mode == 'backward')
+    base = current_memory()
+    reset_peak_memory()
+    times = []
+    # small batches are repeated until min_seconds have passed, their single runs are too short to be timed reliably
+    while len(times) < repeats or sum(times) < min_seconds:
+        start = time.perf_counter()
+        run_once(model, paras, mode)
+        times.append(time.perf_counter() - start)
+    # the fastest run is the least disturbed by other load on the machine
+    return {'spectra_per_s': batch_size / min(times), 'seconds_per_run': float(np.mean(times)),
+            'peak_mb': max(0, peak_memory() - base) / 1024 ** 2}
+
+
+def run_isolated(*args):
+    # benchmark in a fresh spawned process per combination (max_tasks_per_child would need Python 3.11)
+    with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn')) as pool:
+        return pool.submit(benchmark, *args).result()
+
+
+def compare(results, baseline, tolerance, memory_slack=10.):
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline or 'skipped' in result or 'skipped' in baseline[key]:
+            continue
+        old = baseline[key]
+        speed = result['spectra_per_s'] / old['spectra_per_s']
+        memory = (result['peak_mb'] + 1) / (old['peak_mb'] + 1)
+        # memory differences below memory_slack MB are noise of the allocator
+        flag = speed < 1 - tolerance or (memory > 1 + tolerance and result['peak_mb'] - old['peak_mb'] > memory_slack)
+        print('{:60s} {:8.2f}x speed {:8.2f}x memory{}'.format(key, speed, memory, '  REGRESSION' if flag else ''))
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    rtm_choice = RTM()  # lists of the available models and sensors
+
+    my_parser = argparse.ArgumentParser(description='Benchmark of the RTM throughput and memory')
+    my_parser.add_argument('--lops', nargs='+', default=rtm_choice.lop_list,
+                           help='Leaf models')
+    my_parser.add_argument('--canopies', nargs='+', default=rtm_choice.canopy_arch_list,
+                           help='Canopy models (None = leaf model only)')
+    my_parser.add_argument('--sensors', nargs='+', default=['default', 'Sentinel2_Full', 'EnMAP'],
+                           help="Sensors, 'all' for every .srf file")
+    my_parser.add_argument('--batch_sizes', nargs='+', type=int, default=[1, 100, 10000, 100000],
+                           help='Batch sizes, e.g. 1 10 100 1000 10000 100000')
+    my_parser.add_argument('--threads', nargs='+', type=int, default=[torch.get_num_threads()],
+                           help='Values for torch.set_num_threads')
+    my_parser.add_argument('--modes', nargs='+', default=['forward', 'backward'], choices=['forward', 'backward'],
+                           help="'forward' (no_grad) and/or 'backward' (forward + backward)")
+    my_parser.add_argument('--repeats', type=int, default=3,
+                           help='Timed runs per combination (after an untimed warm-up run)')
+    my_parser.add_argument('--min_seconds', type=float, default=1.,
+                           help='Minimum time spent on the timed runs of a combination')
+    my_parser.add_argument('--max_seconds', type=float, default=600.,
+                           help='Skip a batch size if its estimated run time exceeds this')
+    my_parser.add_argument('--max_memory', type=float, default=1.,
+                           help='Memory budget of InitModel in GB, larger batches are chunked (0: no chunking)')
+    my_parser.add_argument('--output', type=str, default=os.path.join(project_root, 'rtm_benchmark.json'),
+                           help='JSON file with the results')
+    my_parser.add_argument('--baseline', type=str,
+                           default=os.path.join(project_root, 'benchmarks', 'rtm_benchmark_baseline.json'),
+                           help='JSON file with the baseline results')
+    my_parser.add_argument('--update_baseline', action='store_true',
+                           help='Store the results as the new baseline instead of comparing')
+    my_parser.add_argument('--tolerance', type=float, default=0.2,
+                           help='Relative slowdown/memory increase counted as a regression')
+    my_parser.add_argument('--seed', type=int, default=155)
+
+    args = my_parser.parse_args()
+    sensors = rtm_choice.sensor_list if args.sensors == ['all'] else args.sensors
+    max_memory = args.max_memory * 1024 ** 3 if args.max_memory else None
+
+    results = {}
+    for threads in args.threads:
+        for lop in args.lops:
+            for canopy_arch in args.canopies:
+                for sensor in sensors:
+                    for mode in args.modes:
+                        seconds_per_sample = 0.
+                        for batch_size in sorted(args.batch_sizes):
+                            key = '{}/{}/{}/b{}/t{}/{}'.format(lop, canopy_arch, sensor, batch_size, threads, mode)
+                            if seconds_per_sample * batch_size * args.repeats > args.max_seconds:
+                                results[key] = {'skipped': 'estimated run time above --max_seconds'}
+                                continue
+                            results[key] = run_isolated(lop, canopy_arch, sensor, batch_size, threads, mode,
+                                                        args.repeats, args.min_seconds, max_memory, args.seed)
+                            seconds_per_sample = results[key]['seconds_per_run'] / batch_size
+                            print('{:60s} {:12.1f} spectra/s {:10.1f} MB'.format(
+                                key, results[key]['spectra_per_s'], results[key]['peak_mb']))
+
+    output = {'device': str(device), 'torch': torch.__version__, 'platform': platform.platform(),
+              'processor': platform.processor(), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=1)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(output, f, indent=1)
+        print('Baseline written to {}'.format(args.baseline))
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['device'] != output['device']:
+            print('Warning: baseline was measured on {}'.format(baseline['device']))
+        regressions = compare(results, baseline['results'], args.tolerance)
+        print('{:d} regressions'.format(len(regressions)))
+        sys.exit(1 if regressions else 0)
+    else:
+        print('No baseline at {}, run with --update_baseline to store one'.format(args.baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import sys
+import os
+import argparse
+import warnings
+warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import torch
+
+from rtm_torch.lut import lut_defaults
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+from rtm_torch.Resources.PROSAIL.soil_library import SoilLibrary
+
+# Checks that inference runs (InitModel(inference=True)) and gradient runs can be mixed in one process: the first
+# inference run creates the shared tables (PROSPECT/SAIL tables, SRF matrices, soil basis), which must not become
+# inference tensors. Every combination is run with inference first, then with gradients, each in a fresh process:
+#
+#   python scripts/inference_mode_check.py
+
+COMBINATIONS = [('prospectD', 'sail', 'default', False), ('prospectPro', 'inform', 'EnMAP', False),
+                ('prospect5B', None, 'Sentinel2_Full', False), ('prospectPro', 'sail', ['EnMAP', 'Sentinel2_Full'], True)]
+
+
+def make_paras(model, batch_size, soil):
+    defaults = lut_defaults(model.canopy_arch)
+    paras = {k: torch.full((batch_size,), float(defaults[k])) for k in model.para_names}
+    if soil:
+        paras['soil_weights'] = torch.rand(batch_size, len(model.soil_library))
+    return paras
+
+
+def check(lop, canopy_arch, sensor, soil, batch_size):
+    library = SoilLibrary.default() if soil else None
+    inference = InitModel(lop=lop, canopy_arch=canopy_arch, s2s=sensor, inference=True, soil_library=library)
+    inference.run_model(make_paras(inference, batch_size, soil))
+
+    model = InitModel(lop=lop, canopy_arch=canopy_arch, s2s=sensor, soil_library=library)
+    paras = make_paras(model, batch_size, soil)
+    paras['cab'].requires_grad_(True)
+    spectra = model.run_model(paras)
+    spectra = torch.cat(list(spectra.values()), dim=1) if isinstance(spectra, dict) else spectra
+    spectra.sum().backward()
+    return bool(torch.isfinite(paras['cab'].grad).all())
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description='Inference runs followed by gradient runs in one process')
+    my_parser.add_argument('--batch_size', type=int, default=8)
+    my_parser.add_argument('--combination', type=int, default=None, help=argparse.SUPPRESS)
+    args = my_parser.parse_args()
+
+    if args.combination is not None:
+        sys.exit(0 if check(*COMBINATIONS[args.combination], args.batch_size) else 1)
+
+    # a fresh process per combination, the tables must not have been created before the inference run
+    import subprocess
+    failed = False
+    for i, (lop, canopy_arch, sensor, soil) in enumerate(COMBINATIONS):
+        result = subprocess.run([sys.executable, __file__, '--combination', str(i),
+                                 '--batch_size', str(args.batch_size)], capture_output=True, text=True)
+        ok = result.returncode == 0
+        print('{:12s} {:7s} {:30s} soil library: {!s:5s} {}'.format(lop, str(canopy_arch), str(sensor), soil,
+                                                                   'passed' if ok else 'FAILED'))
+        if not ok:
+            print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else '')
+        failed |= not ok
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
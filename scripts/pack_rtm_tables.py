@@ -0,0 +1,34 @@
+import sys
+import os
+import argparse
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import rtm_torch.Resources.PROSAIL.dataSpec_tables as dataSpec_tables
+import rtm_torch.Resources.PROSAIL.SAILdata_tables as SAILdata_tables
+
+# Packs the coefficient tables of PROSPECT (dataSpec_tables.py) and 4SAIL (SAILdata_tables.py) into the .npz
+# archives read by dataSpec.py and SAILdata.py. Run it again after changing a table.
+
+my_parser = argparse.ArgumentParser(description='Pack the RTM coefficient tables into .npz archives')
+
+my_parser.add_argument('--out_dir',
+                       metavar='out_dir',
+                       type=str,
+                       default=os.path.join(project_root, 'src', 'rtm_torch', 'Resources', 'PROSAIL'),
+                       help='Directory of dataSpec.npz and SAILdata.npz')
+
+args = my_parser.parse_args()
+
+
+def pack(module, path):
+    tables = {name: value for name, value in vars(module).items()
+              if isinstance(value, np.ndarray) and not name.startswith('_')}
+    np.savez(path, **tables)
+    print('{}: {:d} tables, {:.0f} kB'.format(path, len(tables), os.path.getsize(path) / 1024))
+
+
+pack(dataSpec_tables, os.path.join(args.out_dir, 'dataSpec.npz'))
+pack(SAILdata_tables, os.path.join(args.out_dir, 'SAILdata.npz'))
@@ -0,0 +1,101 @@
+import sys
+import os
+import argparse
+import time
+import warnings
+warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import torch
+
+from rtm_torch.Resources.PROSAIL.prospect import Prospect
+
+# Checks the recompute-based backward of Prospect (prospect.PlateModel) against autograd through the stored
+# intermediates: gradcheck in float64, agreement of the gradients in float32, bytes kept for the backward pass and
+# forward + backward throughput:
+#
+#   python scripts/prospect_backward_check.py --batch_sizes 100 1000 10000
+
+# parameters of each Prospect version in the order of its arguments, with the sampling ranges
+RANGES = {'N': (1.0, 3.0), 'Cab': (0.0, 80.0), 'Car': (0.0, 20.0), 'Anth': (0.0, 5.0), 'Cp': (0.0, 0.003),
+          'Cbc': (0.0, 0.02), 'Cbrown': (0.0, 1.0), 'Cw': (0.001, 0.05), 'Cm': (0.001, 0.05)}
+VERSIONS = {'prospectPro': ('prospect_Pro', ['N', 'Cab', 'Car', 'Anth', 'Cp', 'Cbc', 'Cbrown', 'Cw']),
+            'prospectD': ('prospect_D', ['N', 'Cab', 'Car', 'Anth', 'Cbrown', 'Cw', 'Cm']),
+            'prospect5B': ('prospect_5B', ['N', 'Cab', 'Car', 'Cbrown', 'Cw', 'Cm']),
+            'prospect5': ('prospect_5', ['N', 'Cab', 'Car', 'Cw', 'Cm']),
+            'prospect4': ('prospect_4', ['N', 'Cab', 'Cw', 'Cm'])}
+
+
+def make_inputs(lop, batch_size, dtype, generator):
+    names = VERSIONS[lop][1]
+    return [(torch.rand(batch_size, generator=generator, dtype=dtype) * (RANGES[k][1] - RANGES[k][0]) +
+             RANGES[k][0]).requires_grad_(True) for k in names]
+
+
+def leaf_model(lop, recompute, bands=None):
+    method = getattr(Prospect(bands, recompute=recompute), VERSIONS[lop][0])
+    # reflectance and transmittance, without the wavelength column
+    return lambda *paras: method(*paras)[..., 1:]
+
+
+def saved_bytes(fn, inputs):
+    # bytes of all tensors autograd keeps for the backward pass
+    total = [0]
+
+    def pack(tensor):
+        total[0] += tensor.numel() * tensor.element_size()
+        return tensor
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda tensor: tensor):
+        out = fn(*inputs)
+    return out, total[0]
+
+
+def throughput(fn, inputs, min_seconds):
+    times = []
+    while len(times) < 3 or sum(times) < min_seconds:
+        start = time.perf_counter()
+        grads = torch.autograd.grad(fn(*inputs).sum(), inputs)
+        times.append(time.perf_counter() - start)
+    return len(inputs[0]) / min(times), grads
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description='Recompute-based backward of Prospect vs. autograd')
+    my_parser.add_argument('--lops', nargs='+', default=list(VERSIONS), help='Prospect versions')
+    my_parser.add_argument('--batch_sizes', nargs='+', type=int, default=[100, 1000, 10000])
+    my_parser.add_argument('--gradcheck_samples', type=int, default=3,
+                           help='Samples of the float64 gradcheck (restricted to every 50th wavelength)')
+    my_parser.add_argument('--min_seconds', type=float, default=1.)
+    my_parser.add_argument('--seed', type=int, default=0)
+    args = my_parser.parse_args()
+
+    generator = torch.Generator().manual_seed(args.seed)
+    failed = False
+    for lop in args.lops:
+        inputs = make_inputs(lop, args.gradcheck_samples, torch.float64, generator)
+        ok = torch.autograd.gradcheck(leaf_model(lop, True, bands=tuple(range(0, 2101, 50))), inputs,
+                                      eps=1e-6, atol=1e-5, rtol=1e-3, raise_exception=False)
+        print('{:12s} gradcheck {}'.format(lop, 'passed' if ok else 'FAILED'))
+        failed |= not ok
+
+        for batch_size in args.batch_sizes:
+            inputs = make_inputs(lop, batch_size, torch.float32, generator)
+            stats = {}
+            for recompute in (False, True):
+                fn = leaf_model(lop, recompute)
+                _, stats[recompute, 'bytes'] = saved_bytes(fn, inputs)
+                stats[recompute, 'speed'], stats[recompute, 'grads'] = throughput(fn, inputs, args.min_seconds)
+            deviation = max(((a - b).abs().max() / a.abs().max().clamp(min=1e-30)).item()
+                            for a, b in zip(stats[False, 'grads'], stats[True, 'grads']))
+            print('{:12s} b{:<7d} saved {:9.1f} MB -> {:8.1f} MB   {:10.1f} -> {:10.1f} spectra/s   '
+                  'max rel. grad deviation {:.1e}'.format(lop, batch_size, stats[False, 'bytes'] / 1024 ** 2,
+                                                          stats[True, 'bytes'] / 1024 ** 2, stats[False, 'speed'],
+                                                          stats[True, 'speed'], deviation))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+import sys
+import os
+import glob
+import json
+import argparse
+import warnings
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import numpy as np
+import pandas as pd
+import torch
+
+from rtm_torch.Resources.Spec2Sensor.Spec2Sensor_core import MultiSpec2Sensor
+
+# Resamples measured spectra (the split shards of Split_data.py or any CSV/Parquet with the columns '400'...'2500')
+# to the bands of one or more sensors. Every shard is read chunk by chunk; all sensors are obtained from one matrix
+# product with the stacked SRF matrices of MultiSpec2Sensor, which every worker builds once per set of input
+# wavelengths. The shards are distributed over a pool of worker processes:
+#
+#   python scripts/resample_sensors.py --input Splits --sensors EnMAP Sentinel2_Full --output Splits_sensors
+#
+# writes Splits_sensors/<sensor>/<shard> with the metadata columns of the shard followed by the sensor bands
+# (column names: band centre in nm), and Splits_sensors/manifest.json with the configuration, the band centres of
+# every sensor and the finished shards. A shard's outputs are written under a temporary name and renamed when
+# complete, so an interrupted run continues with the unfinished shards when started again.
+# Wavelengths missing from a shard are ignored by the SRFs; bands without any weight are set to --nodat. NaN in a
+# spectrum only propagates to the bands whose SRFs weight its wavelength, the other bands are resampled as usual.
+# Shards without rows give outputs with the column names only.
+
+INPUT_FORMATS = ('.csv', '.parquet')
+
+# Each worker process holds one MultiSpec2Sensor per set of input wavelengths
+_worker = {}
+
+
+def _init_worker(sensors, nodat, num_threads):
+    torch.set_num_threads(num_threads)
+    _worker.update(sensors=sensors, nodat=nodat, s2s={})
+
+
+def _sensor(wavelengths):
+    # the SRF matrices are built on the first chunk and cached by MultiSpec2Sensor
+    if wavelengths not in _worker['s2s']:
+        s2s = MultiSpec2Sensor(nodat=_worker['nodat'], sensors=_worker['sensors'])
+        if not s2s.init_sensor():
+            raise Exception("Could not convert spectra to sensor resolution!")
+        s2s.set_wavelengths(torch.tensor(wavelengths))
+        _worker['s2s'][wavelengths] = s2s
+    return _worker['s2s'][wavelengths]
+
+
+def spectral_columns(columns):
+    # columns named by an integer wavelength within 400-2500 nm -> (column names, wavelengths)
+    names, wavelengths = [], []
+    for column in columns:
+        try:
+            wl = float(column)
+        except (TypeError, ValueError):
+            continue
+        if wl.is_integer() and 400 <= wl <= 2500:
+            names.append(column)
+            wavelengths.append(int(wl))
+    return names, tuple(wavelengths)
+
+
+def band_names(s2s, sensor):
+    return ['{:g}'.format(float(wl)) for wl in s2s.s2s[s2s.sensors.index(sensor)].wl_sensor]
+
+
+def read_chunks(path, chunk_size):
+    # at least one chunk, a shard without rows gives an empty frame with its columns
+    if path.endswith('.csv'):
+        empty = True
+        for chunk in pd.read_csv(path, chunksize=chunk_size, low_memory=False):
+            empty = False
+            yield chunk
+        if empty:
+            yield pd.read_csv(path, nrows=0)
+    else:
+        # pandas reads Parquet files as a whole (as in utils_data.split_parquets_with_proportions_sequential)
+        df = pd.read_parquet(path)
+        for start in range(0, max(len(df), 1), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
+
+def resample(s2s, reflectance):
+    # stacked bands of all sensors; NaN wavelengths are left out of the matrix product, which would spread them to
+    # every band, and only the bands with a weight on them become NaN
+    missing = torch.isnan(reflectance)
+    if not missing.any():
+        return s2s.run_srf(reflectance)
+    matrix = s2s.srf_matrix(reflectance.device, reflectance.dtype)[0]
+    affected = (missing.to(matrix.dtype) @ (matrix != 0).to(matrix.dtype)) > 0
+    return torch.where(affected, torch.nan, s2s.run_srf(torch.nan_to_num(reflectance)))
+
+
+def output_paths(output, sensors, shard):
+    return {sensor: os.path.join(output, sensor, shard) for sensor in sensors}
+
+
+def _resample_shard(path, shard, output, chunk_size, dtype, keep_meta):
+    """Resamples one shard to all sensors; returns (shard, rows)"""
+    outputs = output_paths(output, _worker['sensors'], shard)
+    tmp = {sensor: out + '.tmp' for sensor, out in outputs.items()}
+    parts = {sensor: [] for sensor in outputs}  # Parquet outputs are written at the end of the shard
+    rows = 0
+    for chunk in read_chunks(path, chunk_size):
+        names, wavelengths = spectral_columns(chunk.columns)
+        if not names:
+            raise ValueError("{} has no spectral columns within 400-2500 nm".format(path))
+        s2s = _sensor(wavelengths)
+        with torch.inference_mode():
+            reflectance = torch.from_numpy(chunk[names].to_numpy(dtype=np.float64)).to(dtype)
+            bands = s2s.split(resample(s2s, reflectance))
+        meta = chunk.drop(columns=names + [c for c in ['Unnamed: 0'] if c in chunk.columns])
+        meta = meta.reset_index(drop=True) if keep_meta else meta.iloc[:, :0].reset_index(drop=True)
+        for sensor in outputs:
+            df = pd.concat([meta, pd.DataFrame(bands[sensor].numpy(), columns=band_names(s2s, sensor))], axis=1)
+            if shard.endswith('.csv'):
+                df.to_csv(tmp[sensor], mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+            else:
+                parts[sensor].append(df)
+        rows += len(chunk)
+
+    for sensor in outputs:
+        if shard.endswith('.parquet'):
+            pd.concat(parts[sensor], ignore_index=True).to_parquet(tmp[sensor], index=False)
+        os.replace(tmp[sensor], outputs[sensor])
+    return shard, rows
+
+
+def find_shards(inputs):
+    # files, directories (all CSV/Parquet files in them) or glob patterns -> sorted list of shard paths
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths += [os.path.join(item, f) for f in os.listdir(item) if f.endswith(INPUT_FORMATS)]
+        else:
+            paths += [p for p in glob.glob(item) if p.endswith(INPUT_FORMATS)]
+    paths = sorted(set(os.path.abspath(p) for p in paths))
+    names = [os.path.basename(p) for p in paths]
+    if len(set(names)) != len(names):
+        raise ValueError("The input shards need unique file names")
+    return paths
+
+
+def write_manifest(output, manifest):
+    # write to a temporary file first so that an interruption never leaves a broken manifest
+    tmp = os.path.join(output, 'manifest.json.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, os.path.join(output, 'manifest.json'))
+
+
+def prepare(output, config):
+    # create the output directories and the manifest, or load the manifest of an interrupted run
+    manifest_path = os.path.join(output, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest['config'] != json.loads(json.dumps(config)):
+            raise ValueError("{} contains resampled shards with a different configuration".format(output))
+        return manifest
+
+    for sensor in config['sensors']:
+        os.makedirs(os.path.join(output, sensor), exist_ok=True)
+    s2s = MultiSpec2Sensor(nodat=config['nodat'], sensors=config['sensors'])
+    if not s2s.init_sensor():
+        raise Exception("Could not convert spectra to sensor resolution!")
+    manifest = {'config': config,
+                'sensors': {sensor: {'bands': band_names(s2s, sensor), 'dir': sensor} for sensor in s2s.sensors},
+                'shards': {}}
+    write_manifest(output, manifest)
+    return manifest
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description='Resampling of measured spectra shards to sensor bands')
+    my_parser.add_argument('--input', nargs='+', default=[os.path.join(project_root, 'Splits')],
+                           help='Shards: CSV/Parquet files, directories or glob patterns')
+    my_parser.add_argument('--sensors', nargs='+', default=['EnMAP', 'Sentinel2_Full'],
+                           help='Sensors of Resources/Spec2Sensor/srf')
+    my_parser.add_argument('--output', type=str, default=os.path.join(project_root, 'Splits_sensors'))
+    my_parser.add_argument('--chunk_size', type=int, default=5000, help='Rows read and resampled at a time')
+    my_parser.add_argument('--n_workers', type=int, default=None,
+                           help='Worker processes, one shard at a time each (default: all cores, 0: in-process)')
+    my_parser.add_argument('--nodat', type=float, default=-999)
+    my_parser.add_argument('--dtype', type=str, default='float32', choices=['float32', 'float64'])
+    my_parser.add_argument('--drop_meta', action='store_true', help='Write only the sensor bands')
+    args = my_parser.parse_args()
+
+    config = {'sensors': args.sensors, 'nodat': args.nodat, 'dtype': args.dtype, 'keep_meta': not args.drop_meta}
+    manifest = prepare(args.output, config)
+    paths = find_shards(args.input)
+    todo = [p for p in paths if os.path.basename(p) not in manifest['shards']]
+    print("{:d} shards, {:d} to resample to {}".format(len(paths), len(todo), ', '.join(args.sensors)))
+    # progress among the shards of this run, the manifest can also list shards of earlier runs
+    shards = {os.path.basename(p) for p in paths}
+
+    def finished(path, shard, rows):
+        outputs = output_paths('', args.sensors, shard)
+        manifest['shards'][shard] = {'input': path, 'rows': rows,
+                                     'outputs': {sensor: out.lstrip(os.sep) for sensor, out in outputs.items()}}
+        write_manifest(args.output, manifest)
+        print("{} done ({:d} rows, {:d}/{:d})".format(shard, rows, len(shards.intersection(manifest['shards'])),
+                                                      len(paths)))
+
+    dtype = getattr(torch, args.dtype)
+    tasks = [(p, os.path.basename(p), args.output, args.chunk_size, dtype, config['keep_meta']) for p in todo]
+    n_workers = min(os.cpu_count() if args.n_workers is None else args.n_workers, len(tasks))
+    if n_workers == 0:
+        _init_worker(args.sensors, args.nodat, torch.get_num_threads())
+        for task in tasks:
+            finished(task[0], *_resample_shard(*task))
+        return
+
+    threads = max(1, os.cpu_count() // n_workers)
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp.get_context('spawn'), initializer=_init_worker,
+                             initargs=(args.sensors, args.nodat, threads)) as pool:
+        futures = {pool.submit(_resample_shard, *task): task[0] for task in tasks}
+        for future in as_completed(futures):
+            finished(futures[future], *future.result())
+
+
+if __name__ == '__main__':
+    main()
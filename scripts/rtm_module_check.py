@@ -0,0 +1,69 @@
+import sys
+import os
+import json
+import argparse
+import tempfile
+import warnings
+warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import torch
+
+from rtm_torch.rtm_module import RTMModule, load_rtm_module, check_parity
+
+# Checks the exportable RTM chain (rtm_module.RTMModule) against the eager InitModel.run_model: for every combination
+# of leaf model, canopy model and sensor, the traced module, the TorchScript artifact after the export -> load round
+# trip and torch.compile(dynamic=True) are compared with check_parity. Exit code 1 if a deviation exceeds --tolerance:
+#
+#   python scripts/rtm_module_check.py --tolerance 1e-5
+
+COMBINATIONS = [('prospectD', 'sail', 'default'), ('prospectPro', 'sail', 'Sentinel2_Full'),
+                ('prospectPro', 'inform', 'EnMAP'), ('prospect5B', None, 'Sentinel2_Full'),
+                ('prospectPro', 'sail', ['EnMAP', 'Sentinel2_Full'])]
+
+rtm_paras = json.load(open(os.path.join(project_root, 'src', 'rtm_torch', 'rtm_paras.json')))
+
+
+def variants(module, tmp_dir):
+    # (name, callable module, configuration) of the traced, exported and compiled chain
+    yield 'trace', module.trace(), module.config
+    path = os.path.join(tmp_dir, 'rtm_module.pt')
+    module.export(path)
+    exported, config = load_rtm_module(path)
+    yield 'export', exported, config
+    if hasattr(torch, 'compile'):
+        yield 'compile', torch.compile(module, dynamic=True), module.config
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description='Parity of the traced, exported and compiled RTM chain')
+    my_parser.add_argument('--num_samples', type=int, default=64)
+    my_parser.add_argument('--tolerance', type=float, default=1e-5,
+                           help='Maximum absolute deviation from the eager run_model (reflectance units)')
+    my_parser.add_argument('--seed', type=int, default=0)
+    args = my_parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for lop, canopy_arch, sensor in COMBINATIONS:
+            module = RTMModule(lop=lop, canopy_arch=canopy_arch, sensor=sensor)
+            try:
+                results = [(name, check_parity(fn, config, rtm_paras, num_samples=args.num_samples, seed=args.seed))
+                           for name, fn, config in variants(module, tmp_dir)]
+            except Exception as e:
+                results = [('error', {'max_abs': float('nan'), 'max_rel': float('nan'), 'message': repr(e)})]
+            for name, deviation in results:
+                ok = deviation['max_abs'] <= args.tolerance
+                print('{:12s} {:7s} {:30s} {:8s} max abs {:.1e}  max rel {:.1e}  {}'.format(
+                    lop, str(canopy_arch), str(sensor), name, deviation['max_abs'], deviation['max_rel'],
+                    'passed' if ok else 'FAILED'))
+                if 'message' in deviation:
+                    print(deviation['message'])
+                failed |= not ok
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
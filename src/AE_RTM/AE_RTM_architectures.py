@@ -90,10 +90,26 @@ class AE_RTM(nn.Module):
         assert hidden_dim == len(
             self.rtm_paras), "hidden_dim must be equal to the number of RTM parameters"
 
+        # Optional neural emulator of the RTM (rtm_torch.emulator.RTMEmulator), see attach_emulator
+        self.emulator = None
+
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.to(self.device)  # Ensure the model is on the correct device
 
+    def attach_emulator(self, emulator):
+        """
+        Replace the physical RTM by a frozen emulator while the model is in training mode;
+        in eval mode (validation) the physical RTM is used
+        """
+        if emulator is not None:
+            emulator.requires_grad_(False)
+            emulator.to(self.device)
+        self.emulator = emulator
+
     def decode(self, para_dict):
+        if self.emulator is not None and self.training:
+            return self.emulator(para_dict)
+
         i_model = CallModel(soil=None, paras=para_dict)
         for key, value in i_model.par.items():
             i_model.par[key] = value.to(self.device)
@@ -121,26 +137,8 @@ class AE_RTM(nn.Module):
             result = i_model.prospect[:, :, 1]
         return result
 
-    def adjust_dict_values(self, dictionary, desired_length):
-        """
-        Adjust the tensor arrays within a dictionary to the desired length by truncating or padding with the last number.
-        """
-        updated_dict = {}
-        for key, value in dictionary.items():
-            # Get the last number in the tensor array
-            last_number = value[-1].item()  # Extract the last number from the tensor
-            # Pad the tensor array with the last number to the desired length
-            padded_value = torch.nn.functional.pad(value, (0, desired_length - len(value)), value=last_number)
-            # Truncate if necessary
-            updated_value = padded_value[:desired_length]
-            # Update the dictionary with the modified tensor array
-            updated_dict[key] = updated_value
-    
-        return updated_dict
-
     def forward(self, x):
         x = x.to(self.device)
-        batch_size = x.size(0)
         encoded = self.encoder(x)  # Encoded parameters
 
         if self.scaler_list is not None:
@@ -158,14 +156,11 @@ class AE_RTM(nn.Module):
         # Create parameter dictionary
         para_dict = {para_name: para_tensor[:, i] for i, para_name in enumerate(self.rtm_paras.keys())}
 
-        # Reset decoder parameters
+        # Reset decoder parameters; the fixed parameters are scalars and broadcast to the batch size by CallModel
         self.decoder.para_reset(**para_dict)
 
-        # Adjust dictionary values if necessary
-        updated_dict = self.adjust_dict_values(self.decoder.para_dict, batch_size)
-
         # Decode to get the output spectrum
-        out = self.decode(updated_dict)
+        out = self.decode(self.decoder.para_dict)
 
         return encoded, out
 
@@ -53,6 +53,8 @@ class Settings_ae:
         self.loss_recons_criterion = CosineSimilarityLoss()  # mse_loss alternative
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.lamb = 1e0
+        # Optional RTM emulator used instead of the physical RTM during training (rtm_torch.emulator)
+        self.rtm_emulator = None
 
     def update_from_dict(self, settings_dict):
         """Update settings attributes from a dictionary."""
@@ -103,6 +105,7 @@ class Trainer_AE_RTM:
         """Instantiate the model, transformation layer, and loss criterion."""
         self.model = AE_RTM_corr(self.settings.input_shape, self.settings.n_lb,
                                  scaler_list=self.settings.scaler_model)
+        self.model.attach_emulator(self.settings.rtm_emulator)
         self.transformation_setup()
         self.criterion_setup()
 
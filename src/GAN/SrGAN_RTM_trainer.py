@@ -56,6 +56,10 @@ class Settings:
 
         self.rtm_D = False
         self.rtm_G = False
+        # Optional RTM emulator used instead of the physical RTM during training (rtm_torch.emulator)
+        self.rtm_emulator = None
+        # Sampling design of the RTM parameters that are not predicted (rtm_torch.sampling.DESIGNS)
+        self.para_design = 'uniform'
 
         self.lambda_fk = 1e0
         self.lambda_un = 1e1
@@ -588,7 +592,7 @@ class SrGAN_RTM():
         rtm_paras = json.load(open('./rtm_torch/rtm_paras.json')) ###
         num_samples = unlabeled_examples.size(0)
         
-        para_dict = para_sampling(rtm_paras, num_samples=num_samples)
+        para_dict = para_sampling(rtm_paras, num_samples=num_samples, design=self.settings.para_design)
         
         ######## From predictionsof discrim #######
         # ls_tr = ["cab", "cw", "cm", "LAI", "cp", "cbc", "car", "anth"]
@@ -624,6 +628,12 @@ class SrGAN_RTM():
         para_dict['psoil']= 0.8 * torch.ones(num_samples) #0.8 # %
         
         int_boost = 1
+        wv = list(['{}'.format(i) for i in range(400,2501)])
+        if self.settings.rtm_emulator is not None and self.D.training:
+            samples = self.settings.rtm_emulator(para_dict) * int_boost
+            samples = pd.DataFrame(samples.detach().cpu().numpy(), columns=wv)
+            return feature_preparation(samples).iloc[:,:-1]
+
         self.i_model = CallModel(soil=None, paras=para_dict)
         
         for key, value in self.i_model.par.items():
@@ -637,7 +647,6 @@ class SrGAN_RTM():
         spectra_leaf = self.i_model.call_prospectPro()
         samples = self.i_model.call_4sail() * int_boost
         
-        wv = list(['{}'.format(i) for i in range(400,2501)])
         samples = pd.DataFrame(samples.detach().cpu().numpy(), columns=wv) 
         samples_clean = feature_preparation(samples).iloc[:,:-1]
         return samples_clean
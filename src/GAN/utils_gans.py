@@ -18,6 +18,7 @@ from scipy.stats import rv_continuous
 import math
 import numpy as np
 import torch
+from rtm_torch.sampling import derived_paras, make_sampler
 
 
 class MixtureModel(rv_continuous):
@@ -178,19 +179,20 @@ def convert_to_settings_list(settings, shuffle=True):
 
 
 ### for RTM ###
-def para_sampling(rtm_paras, num_samples=100):
-    pi_tensor = torch.tensor(math.pi)
-    
+def para_sampling(rtm_paras, num_samples=100, design='uniform', seed=None):
+    # design: 'uniform' (independent torch.rand draws) or a space-filling design of rtm_torch.sampling.DESIGNS
+    # ('lhs', 'sobol', 'truncnorm'); without seed every call draws a new design from the torch random state
+    if design != 'uniform':
+        if seed is None:
+            seed = int(torch.randint(2 ** 31, ()))
+        return make_sampler(design, rtm_paras, num_samples, seed=seed).sample()
+
     # run uniform sampling for learnable parameters
     para_dict = {}
     for para_name in rtm_paras.keys():
         min = rtm_paras[para_name]['min']
         max = rtm_paras[para_name]['max']
         para_dict[para_name] = torch.rand(num_samples) * (max - min) + min
-    SD = 500
-    para_dict['cd'] = torch.sqrt(
-        (para_dict['fc']*10000)/(pi_tensor*SD))*2 #pi_tensor torch.pi
-    para_dict['h'] = torch.exp(
-        2.117 + 0.507*torch.log(para_dict['cd']))
 
-    return para_dict
\ No newline at end of file
+    # crown diameter 'cd' and tree height 'h' from the crown cover 'fc'
+    return derived_paras(para_dict)
\ No newline at end of file
@@ -16,18 +16,45 @@ Remote Sensing of Environment, 16, 125-141. Article.
 
 import torch
 import math
-from rtm_torch.Resources.PROSAIL.dataSpec import *
-from rtm_torch.Resources.PROSAIL.SAILdata import *
+import threading
+from collections import OrderedDict
+from rtm_torch.Resources.PROSAIL import dataSpec, SAILdata
+from rtm_torch.Resources.constants import ConstantRegistry
+from rtm_torch.Resources.special import exporting
 
-device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-# device = "cpu"
+
+# LRU cache of the LIDF weighted geometry terms (ks, ko, bf, sob, sof), see Sail.geometry_terms
+GEOMETRY_CACHE_SIZE = 256
+_geometry_cache = OrderedDict()
+_geometry_lock = threading.Lock()
+
+
+def clear_geometry_cache():
+    with _geometry_lock:
+        _geometry_cache.clear()
+
+
+# Step (degrees) of the table of ellipsoidal LIDF frequencies over the average leaf angle 0-90, which are
+# interpolated linearly in lidf_calc (None: Sail.campbell is evaluated for every sample)
+CAMPBELL_TABLE_STEP = 0.01
+
+
+def _campbell_table(step):
+    # computed once in float64 from the analytic distribution
+    alia = torch.linspace(0., 90., int(round(90. / step)) + 1, dtype=torch.float64)
+    return {'freq': Sail.campbell(alia).numpy()}
+
+
+_campbell_registry = ConstantRegistry(_campbell_table)
 
 
 class Sail:
-    def __init__(self, tts, tto, psi):
+    # bands: indices of the wavelengths (400-2500 nm) to be modelled, None for all
+    def __init__(self, tts, tto, psi, bands=None):
         self.tts = tts
         self.tto = tto
         self.psi = psi
+        self.bands = bands
 
         # Conversions are done in the __init__ to save time (needed as parameters for the complete set of paras)
         self.sintts = torch.sin(tts)
@@ -40,100 +67,133 @@ class Sail:
                  understory=None, skyl=None, inform_trans=None):
 
         if inform_trans == 'tto':
-            self.tts = self.tto
-            self.sintts = self.costto
-            self.costts = self.costto
+            # transmittance in viewing direction: evaluated with the sun placed at the observer
+            return Sail(self.tto, self.tto, self.psi, self.bands).pro4sail(rho, tau, LIDF, TypeLIDF, LAI, hspot, psoil, soil,
+                                                              understory=understory, skyl=skyl, inform_trans='tts')
 
-        LAI = LAI.unsqueeze(1)  # expand LAI-array to 2D
-        costts_costto = self.costts * self.costto
-        tantts = torch.tan(self.tts)
-        tantto = torch.tan(self.tto)
-        dso = torch.sqrt(tantts ** 2 + tantto ** 2 - 2 *
-                         tantts * tantto * self.cospsi)
+        soil = self.soil_refl(psoil, soil, understory)
 
-        # Soil Reflectance Properties
-        if isinstance(understory, torch.Tensor):
-            soil = understory
-        # "soil" is not supplied as np.array, but is "None" instead
-        elif not isinstance(soil, torch.Tensor):
-            # np.outer = outer product (vectorized)
-            soil = torch.outer(psoil, Rsoil1) + torch.outer((1-psoil), Rsoil2)
+        # Extinction coefficients, area scattering coefficients and backscatter weight weighted with the LIDF
+        ks, ko, bf, sob, sof = self.geometry_terms(LIDF, TypeLIDF)
+        leaf = self.leaf_terms(rho, tau, ks, ko, bf, sob, sof)
 
-        # Generate Leaf Angle Distribution From Average Leaf Angle (ellipsoidal) or (a, b) parameters
-        lidf = self.lidf_calc(LIDF, TypeLIDF)
+        return self.canopy(leaf, self.layer_terms(leaf, LAI), hspot, soil, skyl=skyl, inform_trans=inform_trans)
 
-        # Weighted Sums of LIDF
-        litab = torch.cat(
-            (torch.arange(5, 85, 10), torch.arange(81, 91, 2)), dim=0).to(device)
-        # litab -> 5, 15, 25, 35, 45, ... , 75, 81, 83, ... 89
-        litab = litab * (math.pi / 180)
+    def inform4sail(self, rho, tau, LIDF, TypeLIDF, LAI, LAIu, hspot, psoil, soil, skyl=None):
+        """
+        Fused version of the four pro4sail runs of INFORM. Geometry, LIDF, sigb/sigf, m, rinf and the
+        J-functions are evaluated once and shared between the runs.
+        Returns understory reflectance, infinite crown reflectance and the crown transmittances for tts and tto.
+        """
+        soil = self.soil_refl(psoil, soil)
 
-        chi_s, chi_o, frho, ftau = self.volscatt(litab)
+        ks, ko, bf, sob, sof = self.geometry_terms(LIDF, TypeLIDF)
+        leaf = self.leaf_terms(rho, tau, ks, ko, bf, sob, sof)
 
-        # Extinction coefficients
-        ksli = chi_s / self.costts.unsqueeze(1)
-        koli = chi_o / self.costto.unsqueeze(1)
+        # Step 1: understory reflectance
+        understory = self.canopy(leaf, self.layer_terms(leaf, LAIu), hspot, soil, skyl=skyl)
 
-        # Area scattering coefficient fractions
-        sobli = frho * math.pi / costts_costto.unsqueeze(1)
-        sofli = ftau * math.pi / costts_costto.unsqueeze(1)
-        bfli = torch.cos(litab) ** 2
+        # Step 2: infinite crown reflectance (extreme LAI) with the understory as background
+        inf = self.canopy(leaf, self.layer_terms(leaf, torch.full_like(LAI, 15)), hspot, understory, skyl=skyl)
 
-        # Angular Differences
-        ks = torch.sum(ksli * lidf, dim=1).unsqueeze(1)
-        ko = torch.sum(koli * lidf, dim=1).unsqueeze(1)
-        bf = torch.sum(bfli[None, :] * lidf, dim=1).unsqueeze(1).to(device)
-        sob = torch.sum(sobli * lidf, dim=1).unsqueeze(1)
-        sof = torch.sum(sofli * lidf, dim=1).unsqueeze(1)
+        # Step 3 and 4: crown transmittances without hot spot; both directions share the layer terms of LAI
+        layer = self.layer_terms(leaf, LAI)
+        no_hspot = torch.zeros_like(hspot)
+        tts_trans = self.canopy(leaf, layer, no_hspot, understory, skyl=skyl, inform_trans='tts')
+
+        view = Sail(self.tto, self.tto, self.psi, self.bands)
+        ks_o, _, _, sob_o, sof_o = view.geometry_terms(LIDF, TypeLIDF)
+        leaf_o = view.leaf_terms(rho, tau, ks_o, ko, bf, sob_o, sof_o, shared=leaf)
+        tto_trans = view.canopy(leaf_o, layer, no_hspot, understory, skyl=skyl, inform_trans='tto')
+
+        return understory, inf, tts_trans, tto_trans
 
-        # Geometric factors to be used later with reflectance and transmission
+    def soil_refl(self, psoil, soil, understory=None):
+        # Soil Reflectance Properties
+        if isinstance(understory, torch.Tensor):
+            return understory
+        # "soil" is not supplied as np.array, but is "None" instead
+        elif not isinstance(soil, torch.Tensor):
+            # np.outer = outer product (vectorized)
+            spec = dataSpec.tables('canopy', psoil.device, psoil.dtype, self.bands)
+            return torch.outer(psoil, spec['Rsoil1']) + torch.outer((1-psoil), spec['Rsoil2'])
+        return soil
+
+    def leaf_terms(self, rho, tau, ks, ko, bf, sob, sof, shared=None):
+        # Refl and Transm kick in; the terms that do not depend on the sun direction can be taken from
+        # the leaf terms of another run with the same leaf optics, LIDF and viewing direction (shared)
+        if shared is None:
+            dob = 0.5 * (ko + bf)
+            dof = 0.5 * (ko - bf)
+            ddb = 0.5 * (1 + bf)
+            ddf = 0.5 * (1 - bf)
+
+            sigb = ddb * rho + ddf * tau
+            sigf = ddf * rho + ddb * tau
+            att = 1.0 - sigf
+            m2 = (att + sigb) * (att - sigb)
+            m2[m2 < 0] = 0.0
+            m = torch.sqrt(m2)
+
+            shared = {'rho': rho, 'tau': tau, 'ko': ko, 'm': m,
+                      'rinf': (att - m) / sigb,
+                      'vb': dob*rho + dof*tau,
+                      'vf': dof*rho + dob*tau}
+
+        rho, tau = shared['rho'], shared['tau']
         sdb = 0.5 * (ks + bf)
         sdf = 0.5 * (ks - bf)
-        dob = 0.5 * (ko + bf)
-        dof = 0.5 * (ko - bf)
-        ddb = 0.5 * (1 + bf)
-        ddf = 0.5 * (1 - bf)
-
-        rho = rho.to(device)
-        tau = tau.to(device)
-
-        # Refl and Transm kick in
-        sigb = ddb * rho + ddf * tau
-        sigf = ddf * rho + ddb * tau
-        att = 1.0 - sigf
-        m2 = (att + sigb) * (att - sigb)
-        m2[m2 < 0] = 0.0
-        m = torch.sqrt(m2)
-
-        sb = sdb*rho + sdf*tau
-        sf = sdf*rho + sdb*tau
-        vb = dob*rho + dof*tau
-        vf = dof*rho + dob*tau
-        w = sob*rho + sof*tau
+
+        return dict(shared, ks=ks,
+                    sb=sdb*rho + sdf*tau,
+                    sf=sdf*rho + sdb*tau,
+                    w=sob*rho + sof*tau)
+
+    def layer_terms(self, leaf, LAI):
+        # Terms depending on LAI and the viewing direction only
+        LAI = LAI.unsqueeze(1)  # expand LAI-array to 2D
+        m, rinf, ko = leaf['m'], leaf['rinf'], leaf['ko']
+        vb, vf = leaf['vb'], leaf['vf']
 
         # Include LAI (make sure, LAI is > 0!)
         e1 = torch.exp(-m * LAI)
         e2 = e1 ** 2
-        rinf = (att - m) / sigb
         rinf2 = rinf ** 2
         re = rinf * e1
         denom = 1.0 - rinf2 * e2
 
-        J1ks, tss = self.jfunc1(ks, m, LAI)
-        J2ks = self.jfunc2(ks, m, LAI)
         J1ko, too = self.jfunc1(ko, m, LAI)
         J2ko = self.jfunc2(ko, m, LAI)
 
-        Ps = (sf + sb * rinf) * J1ks
-        Qs = (sf * rinf + sb) * J2ks
         Pv = (vf + vb * rinf) * J1ko
         Qv = (vf * rinf + vb) * J2ko
 
-        rdd = rinf * (1.0 - e2) / denom
-        tdd = (1.0 - rinf2) * e1 / denom
+        return {'LAI': LAI, 'rinf2': rinf2, 're': re, 'denom': denom, 'J1ko': J1ko, 'too': too,
+                'rdd': rinf * (1.0 - e2) / denom,
+                'tdd': (1.0 - rinf2) * e1 / denom,
+                'tdo': (Pv - re * Qv) / denom,
+                'rdo': (Qv - re * Pv) / denom}
+
+    def canopy(self, leaf, layer, hspot, soil, skyl=None, inform_trans=None):
+        # Bidirectional reflectance of the canopy above the background "soil"
+        ks, ko, m, rinf = leaf['ks'], leaf['ko'], leaf['m'], leaf['rinf']
+        sb, sf, vb, vf, w = leaf['sb'], leaf['sf'], leaf['vb'], leaf['vf'], leaf['w']
+        LAI, rinf2, re, denom = layer['LAI'], layer['rinf2'], layer['re'], layer['denom']
+        J1ko, too = layer['J1ko'], layer['too']
+        rdd, tdd, tdo, rdo = layer['rdd'], layer['tdd'], layer['tdo'], layer['rdo']
+
+        tantts = torch.tan(self.tts)
+        tantto = torch.tan(self.tto)
+        dso = torch.sqrt(tantts ** 2 + tantto ** 2 - 2 *
+                         tantts * tantto * self.cospsi)
+
+        J1ks, tss = self.jfunc1(ks, m, LAI)
+        J2ks = self.jfunc2(ks, m, LAI)
+
+        Ps = (sf + sb * rinf) * J1ks
+        Qs = (sf * rinf + sb) * J2ks
+
         tsd = (Ps - re * Qs) / denom
-        tdo = (Pv - re * Qv) / denom
-        rdo = (Qv - re * Pv) / denom
 
         z = self.jfunc2(ks, ko, LAI)
         g1 = (z - J1ks * too) / (ko + m)
@@ -150,23 +210,22 @@ class Sail:
 
         # Hotspot-effect
         alf = torch.where(hspot > 0, ((dso / hspot) * 2.0) /
-                          (ks + ko).flatten(), torch.tensor(200.0).to(device)).unsqueeze(1)
+                          (ks + ko).flatten(), 200.0).unsqueeze(1)
         alf[alf > 200] = 200
 
         fhot = LAI * torch.sqrt(ko * ks)
         fint = (1 - torch.exp(-alf)) * 0.05
-        fint = fint.to(device)
-        
-        i19 = torch.arange(19).to(device)
+
+        i19 = torch.arange(19, device=alf.device)
         x2 = -torch.log(1.0 - (i19 + 1) * fint) / alf
-        x2[:, 18] = torch.ones(x2.shape[0])  # last element in x2 is 1.0
+        x2[:, 18] = 1.0  # last element in x2 is 1.0
         y2 = -(ko + ks) * LAI * x2 + fhot * (1.0 - torch.exp(-alf * x2)) / alf
         f2 = torch.exp(y2)
 
         # Shifts array by one and fills with constant = 0
-        x1 = torch.cat((torch.zeros(x2.shape[0], 1).to(device), x2), dim=1)[:, :-1]
-        y1 = torch.cat((torch.zeros(y2.shape[0], 1).to(device), y2), dim=1)[:, :-1]
-        f1 = torch.cat((torch.ones(f2.shape[0], 1).to(device), f2), dim=1)[
+        x1 = torch.cat((x2.new_zeros(x2.shape[0], 1), x2), dim=1)[:, :-1]
+        y1 = torch.cat((y2.new_zeros(y2.shape[0], 1), y2), dim=1)[:, :-1]
+        f1 = torch.cat((f2.new_ones(f2.shape[0], 1), f2), dim=1)[
             :, :-1]  # -"- with constant = 1
         sumint = torch.sum((f2 - f1) * (x2 - x1) / (y2 - y1), dim=1)
 
@@ -194,80 +253,155 @@ class Sail:
             PARdiro = (1.0 - skyl).unsqueeze(1)
             PARdifo = skyl.unsqueeze(1)
         else:
-            PARdiro = torch.outer((1.0 - skyl), Es)
-            PARdifo = torch.outer(skyl, Ed)
+            spec = dataSpec.tables('canopy', self.tts.device, self.tts.dtype, self.bands)
+            PARdiro = torch.outer((1.0 - skyl), spec['Es'])
+            PARdifo = torch.outer(skyl, spec['Ed'])
 
         resv = (rdot * PARdifo + rsot * PARdiro) / (PARdiro + PARdifo)
 
         return resv
 
+    def geometry_terms(self, LIDF, TypeLIDF, cache=True):
+        """
+        Returns ks, ko, bf, sob and sof with shape (n, 1). They only depend on the sun/view geometry and the
+        leaf angle settings, so with cache=True they are computed once per unique (tts, tto, psi, LIDF) tuple,
+        kept in an LRU cache and broadcast to the batch. The cache is bypassed while the model is traced or compiled.
+        """
+        if not cache or exporting() or any(t.requires_grad for t in (self.tts, self.tto, self.psi, LIDF)):
+            return self._geometry_terms(LIDF, TypeLIDF)
+
+        keys = torch.stack((self.tts, self.tto, self.psi, LIDF), dim=1)
+        uniq, inverse = torch.unique(keys, dim=0, return_inverse=True)
+        if uniq.shape[0] > GEOMETRY_CACHE_SIZE:
+            # more geometries than the cache can hold: only deduplicate within the batch
+            terms = Sail(uniq[:, 0], uniq[:, 1], uniq[:, 2])._geometry_terms(
+                uniq[:, 3], TypeLIDF[:1].expand(uniq.shape[0]))
+            return tuple(t[inverse] for t in terms)
+
+        # all LUT-members share the same TypeLIDF (see lidf_calc)
+        key_list = [(int(TypeLIDF[0]), str(keys.device), keys.dtype) + tuple(row) for row in uniq.tolist()]
+        with _geometry_lock:
+            missing = [i for i, key in enumerate(key_list) if key not in _geometry_cache]
+            if missing:
+                sub = uniq[torch.tensor(missing, device=uniq.device)]
+                terms = torch.cat(Sail(sub[:, 0], sub[:, 1], sub[:, 2])._geometry_terms(
+                    sub[:, 3], TypeLIDF[:1].expand(len(missing))), dim=1)
+                for row, i in enumerate(missing):
+                    _geometry_cache[key_list[i]] = terms[row]
+            for key in key_list:
+                _geometry_cache.move_to_end(key)
+            table = torch.stack([_geometry_cache[key] for key in key_list])  # (n_unique, 5)
+            while len(_geometry_cache) > GEOMETRY_CACHE_SIZE:
+                _geometry_cache.popitem(last=False)
+
+        if table.shape[0] == 1:
+            table = table.expand(keys.shape[0], -1)
+        else:
+            table = table[inverse]
+        return tuple(table[:, i:i + 1] for i in range(5))
+
+    def _geometry_terms(self, LIDF, TypeLIDF):
+        # Generate Leaf Angle Distribution From Average Leaf Angle (ellipsoidal) or (a, b) parameters
+        lidf = self.lidf_calc(LIDF, TypeLIDF)
+
+        # Weighted Sums of LIDF
+        litab = torch.cat(
+            (torch.arange(5, 85, 10), torch.arange(81, 91, 2)), dim=0).to(device=LIDF.device, dtype=LIDF.dtype)
+        # litab -> 5, 15, 25, 35, 45, ... , 75, 81, 83, ... 89
+        litab = litab * (math.pi / 180)
+
+        chi_s, chi_o, frho, ftau = self.volscatt(litab)
+
+        # Extinction coefficients
+        ksli = chi_s / self.costts.unsqueeze(1)
+        koli = chi_o / self.costto.unsqueeze(1)
+
+        # Area scattering coefficient fractions
+        costts_costto = self.costts * self.costto
+        sobli = frho * math.pi / costts_costto.unsqueeze(1)
+        sofli = ftau * math.pi / costts_costto.unsqueeze(1)
+        bfli = torch.cos(litab) ** 2
+
+        # Angular Differences
+        ks = torch.sum(ksli * lidf, dim=1).unsqueeze(1)
+        ko = torch.sum(koli * lidf, dim=1).unsqueeze(1)
+        bf = torch.sum(bfli[None, :] * lidf, dim=1).unsqueeze(1)
+        sob = torch.sum(sobli * lidf, dim=1).unsqueeze(1)
+        sof = torch.sum(sofli * lidf, dim=1).unsqueeze(1)
+
+        return ks, ko, bf, sob, sof
+
     # Calculates the Leaf Angle Distribution Function Value (freq)
     def lidf_calc(self, LIDF, TypeLIDF):
 
         if TypeLIDF[0] == 1:  # Beta-Distribution, all LUT-members need to have same TypeLIDF!
             # look up frequencies for beta-distribution
-            freq = beta_dict[LIDF.long(), :]
-        else:  # Ellipsoidal distribution
+            freq = SAILdata.tables(LIDF.device, LIDF.dtype)['beta_dict'][LIDF.long(), :]
+        elif CAMPBELL_TABLE_STEP is None:  # Ellipsoidal distribution
             freq = self.campbell(LIDF)
+        else:
+            freq = self.campbell_tabulated(LIDF)
 
         return freq
 
+    @staticmethod
+    def campbell_tabulated(ALIA):
+        # Ellipsoidal distribution interpolated linearly from the table of campbell, rows stay normalized
+        table = _campbell_registry.get(CAMPBELL_TABLE_STEP, ALIA.device, ALIA.dtype)['freq']
+        pos = ALIA.clamp(0., 90.) / CAMPBELL_TABLE_STEP
+        i = pos.detach().floor().long().clamp(max=table.shape[0] - 2)
+        return torch.lerp(table[i], table[i + 1], (pos - i).unsqueeze(1))
+
     # Calculates the Leaf Angle Distribution Function value (freq) Ellipsoidal distribution function from ALIA
-    def campbell(self, ALIA):
+    @staticmethod
+    def campbell(ALIA):
 
         n = 13
+        angles = SAILdata.tables(ALIA.device, ALIA.dtype)
+        tan_tl1, tan_tl2 = angles['tan_tl1'], angles['tan_tl2']
         excent = torch.exp(-1.6184e-5 * ALIA.pow(3) + 2.1145e-3 *
                            ALIA.pow(2) - 1.2390e-1 * ALIA + 3.2491)
-        freq = torch.zeros(size=(ALIA.shape[0], n)).to(device)
+        freq = ALIA.new_zeros((ALIA.shape[0], n))
 
         x1 = excent.unsqueeze(1) / \
             torch.sqrt(1.0 + (excent.pow(2)).unsqueeze(1) * tan_tl1)
-        # x1 = x1.to(device)
-        
         x12 = x1.pow(2)
         x2 = excent.unsqueeze(1) / \
             torch.sqrt(1.0 + (excent.pow(2)).unsqueeze(1) * tan_tl2)
-        # x2 = x2.to(device)
-        
         x22 = x2.pow(2)
         alpha = excent / torch.sqrt(torch.abs(1 - excent.pow(2)))
-        alpha2 = (alpha.pow(2)).unsqueeze(1).to(device)
+        alpha2 = (alpha.pow(2)).unsqueeze(1)
 
-        alpx1 = torch.sqrt(alpha2 + x12)#.to(device)
-        alpx2 = torch.sqrt(alpha2 + x22)#.to(device)
+        alpx1 = torch.sqrt(alpha2 + x12)
+        alpx2 = torch.sqrt(alpha2 + x22)
         dump = x1 * alpx1 + alpha2 * torch.log(x1 + alpx1)
 
-        almx1 = torch.sqrt(alpha2 - x12)#.to(device)
-        almx2 = torch.sqrt(alpha2 - x22)#.to(device)
-        
+        almx1 = torch.sqrt(alpha2 - x12)
+        almx2 = torch.sqrt(alpha2 - x22)
+
         dumm = x1 * almx1 + alpha2 * torch.asin(x1 / alpha.unsqueeze(1))
-        # dumm = dumm.to(device)
 
         freq[excent > 1.0, :] = torch.abs(
-            dump - (x2 * alpx2 + alpha2 * torch.log(x2 + alpx2)))[excent > 1.0, :].to(device)
+            dump - (x2 * alpx2 + alpha2 * torch.log(x2 + alpx2)))[excent > 1.0, :]
         freq[excent < 1.0, :] = torch.abs(dumm - (x2 * almx2 + alpha2 *
-                                                  torch.asin(x2 / alpha.unsqueeze(1))))[excent < 1.0, :].to(device)
-        freq[excent == 1.0, :] = torch.abs(cos_tl1 - cos_tl2)
+                                                  torch.asin(x2 / alpha.unsqueeze(1))))[excent < 1.0, :]
+        freq[excent == 1.0, :] = torch.abs(angles['cos_tl1'] - angles['cos_tl2'])
 
         return freq / freq.sum(dim=1).unsqueeze(1)  # Normalize
 
     def volscatt(self, ttl):
 
-        costtl = torch.cos(ttl).to(device)
-        sinttl = torch.sin(ttl).to(device)
+        costtl = torch.cos(ttl)
+        sinttl = torch.sin(ttl)
         cs = torch.outer(self.costts, costtl)
-        # cs = cs.to(device)
         co = torch.outer(self.costto, costtl)
-        # co = co.to(device)
         ss = torch.outer(self.sintts, sinttl)
-        # ss = ss.to(device)
         so = torch.outer(self.sintto, sinttl)
-        # so = so.to(device)
 
-        cosbts = torch.where(torch.abs(ss) > 1e-6, (-cs/ss), torch.tensor(5.0).to(device))
-        cosbto = torch.where(torch.abs(so) > 1e-6, (-co/so), torch.tensor(5.0).to(device))
+        cosbts = torch.where(torch.abs(ss) > 1e-6, (-cs/ss), 5.0)
+        cosbto = torch.where(torch.abs(so) > 1e-6, (-co/so), 5.0)
         bts = torch.where(torch.abs(cosbts) < 1,
-                          torch.acos(cosbts), torch.tensor(math.pi).to(device))
+                          torch.acos(cosbts), math.pi)
         ds = torch.where(torch.abs(cosbts) < 1, ss, cs)
 
         chi_s = 2.0 / \
@@ -275,7 +409,7 @@ class Sail:
                      * cs + torch.sin(bts)*ss)
 
         bto = torch.where(torch.abs(cosbto) < 1, torch.acos(cosbto),
-                          torch.where(self.tto.unsqueeze(1) < math.pi * 0.5, torch.tensor(math.pi).to(device), torch.tensor(0.0).to(device)))
+                          torch.where(self.tto.unsqueeze(1) < math.pi * 0.5, math.pi, 0.0))
         doo = torch.where(torch.abs(cosbto) < 1, so, torch.where(
             self.tto.unsqueeze(1) < math.pi * 0.5, co, -co))
 
@@ -296,7 +430,7 @@ class Sail:
 
         t1 = 2 * cs * co + ss * so * self.cospsi.unsqueeze(1)
         t2 = torch.where(bt2 > 0, torch.sin(bt2) * (2 * ds * doo +
-                                                    ss * so * torch.cos(bt1) * torch.cos(bt3)), torch.tensor(0.0).to(device))
+                                                    ss * so * torch.cos(bt1) * torch.cos(bt3)), 0.0)
 
         denom = 2.0 * math.pi ** 2
         frho = ((math.pi - bt2) * t1 + t2) / denom
@@ -28,15 +28,17 @@
 """
 
 import os
+import copy
 import torch
 import torch.nn as nn
 import numpy as np
+from torch.utils.checkpoint import checkpoint
 from scipy.stats import truncnorm
 import rtm_torch.Resources.PROSAIL.SAIL as SAIL_v
 import rtm_torch.Resources.PROSAIL.INFORM as INFORM_v
 import rtm_torch.Resources.PROSAIL.prospect as prospect_v
 from rtm_torch.Resources.PROSAIL.dataSpec import lambd
-from rtm_torch.Resources.Spec2Sensor.Spec2Sensor_core import Spec2Sensor
+from rtm_torch.Resources.Spec2Sensor.Spec2Sensor_core import Spec2Sensor, MultiSpec2Sensor
 import warnings
 import time
 import math
@@ -44,52 +46,80 @@ import math
 # do not show warnings (set to 'all' if you want to see warnings, too)
 warnings.filterwarnings('ignore')
 
+
+
+def broadcast_paras(paras):
+    """
+    Expands the parameters to a common batch size, the largest number of elements among them. Fixed parameters can be
+    passed as numbers, 0-d or single-element tensors; they are expanded as views, without copies.
+    """
+    ref = max((v for v in paras.values() if isinstance(v, torch.Tensor)), key=torch.numel)
+    n = ref.numel()
+    return {k: torch.as_tensor(v, dtype=ref.dtype, device=ref.device).reshape(-1).expand(n) if not isinstance(
+        v, torch.Tensor) or v.numel() == 1 else v for k, v in paras.items()}
+
+
+def batch_size(paras):
+    # number of samples of a parameter dictionary: the longest first axis (0-d tensors and numbers count as 1)
+    return max(v.shape[0] if isinstance(v, torch.Tensor) and v.dim() else 1 for v in paras.values())
+
 # This class creates instances of the actual models and is fed with parameter inputs
 
 
 class CallModel(nn.Module):
 
-    def __init__(self, soil, paras):
+    def __init__(self, soil, paras, bands=None, inference=False):
         super(CallModel, self).__init__()
         # paras is a dictionary of all input parameters; this allows flexible adding/removing for new models
-        self.par = paras
-        # cab is always part of self.par, so it is used to obtain ninputs
+        # fixed parameters may be scalars, they are broadcast to the batch size
+        self.par = broadcast_paras(paras)
         self.ninputs = self.par['cab'].shape[0]
+        # bands: indices of the wavelengths (400-2500 nm) to be modelled, None for all
+        self.bands = bands
+        if bands is not None and isinstance(soil, torch.Tensor) and soil.shape[-1] == len(lambd):
+            soil = soil[..., list(bands)]
         self.soil = soil
+        # inference: the outputs are returned as they are, without the clones that preserve gradients
+        self.inference = inference
         self.device = torch.device(
             "cuda" if torch.cuda.is_available() else "cpu")
 
+    def output(self, result):
+        if self.inference:
+            return result
+        return result.clone().requires_grad_(True)  # ✅ Preserve gradients
+
     def call_prospect4(self):
-        prospect_instance = prospect_v.Prospect()
-        self.prospect = prospect_instance.prospect_4(
-            self.par["N"], self.par["cab"], self.par["cw"], self.par["cm"]).clone().requires_grad_(True)  # ✅ Preserve gradients
+        prospect_instance = prospect_v.Prospect(self.bands)
+        self.prospect = self.output(prospect_instance.prospect_4(
+            self.par["N"], self.par["cab"], self.par["cw"], self.par["cm"]))
 
         return self.prospect
 
     def call_prospect5(self):
-        prospect_instance = prospect_v.Prospect()
-        self.prospect = prospect_instance.prospect_5(
-            self.par["N"], self.par["cab"], self.par["car"], self.par["cw"], self.par["cm"]).clone().requires_grad_(True)  # ✅ Preserve gradients
+        prospect_instance = prospect_v.Prospect(self.bands)
+        self.prospect = self.output(prospect_instance.prospect_5(
+            self.par["N"], self.par["cab"], self.par["car"], self.par["cw"], self.par["cm"]))
 
         return self.prospect
 
     def call_prospect5b(self):
-        prospect_instance = prospect_v.Prospect()
-        self.prospect = prospect_instance.prospect_5B(
-            self.par["N"], self.par["cab"], self.par["car"], self.par["cbrown"], self.par["cw"], self.par["cm"]).clone().requires_grad_(True)  # ✅ Preserve gradients
+        prospect_instance = prospect_v.Prospect(self.bands)
+        self.prospect = self.output(prospect_instance.prospect_5B(
+            self.par["N"], self.par["cab"], self.par["car"], self.par["cbrown"], self.par["cw"], self.par["cm"]))
 
         return self.prospect
 
     def call_prospectD(self):
-        prospect_instance = prospect_v.Prospect()
-        self.prospect = prospect_instance.prospect_D(
-            self.par["N"], self.par["cab"], self.par["car"], self.par["anth"], self.par["cbrown"], self.par["cw"], self.par["cm"]).clone().requires_grad_(True)  # ✅ Preserve gradients
+        prospect_instance = prospect_v.Prospect(self.bands)
+        self.prospect = self.output(prospect_instance.prospect_D(
+            self.par["N"], self.par["cab"], self.par["car"], self.par["anth"], self.par["cbrown"], self.par["cw"], self.par["cm"]))
         return self.prospect
 
     def call_prospectPro(self):
-        prospect_instance = prospect_v.Prospect()
-        self.prospect = prospect_instance.prospect_Pro(
-            self.par["N"], self.par["cab"], self.par["car"], self.par["anth"], self.par["cp"], self.par["cbc"], self.par["cbrown"], self.par["cw"]).clone().requires_grad_(True)  # ✅ Preserve gradients
+        prospect_instance = prospect_v.Prospect(self.bands)
+        self.prospect = self.output(prospect_instance.prospect_Pro(
+            self.par["N"], self.par["cab"], self.par["car"], self.par["anth"], self.par["cp"], self.par["cbc"], self.par["cbrown"], self.par["cw"]))
         return self.prospect
 
     def call_4sail(self):
@@ -105,11 +135,11 @@ class CallModel(nn.Module):
         psi_rad = self.par["psi"] * (math.pi / 180)
 
         # Create Instance of SAIL and initialize angles
-        sail_instance = SAIL_v.Sail(tts_rad, tto_rad, psi_rad)
+        sail_instance = SAIL_v.Sail(tts_rad, tto_rad, psi_rad, self.bands)
 
-        self.sail = sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2], self.par["LIDF"],
-                                           self.par["typeLIDF"], self.par["LAI"], self.par["hspot"], self.par["psoil"],
-                                           self.soil).clone().requires_grad_(True)  # ✅ Preserve gradients    # call 4SAIL from the SAIL instance
+        self.sail = self.output(sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2], self.par["LIDF"],
+                                                       self.par["typeLIDF"], self.par["LAI"], self.par["hspot"],
+                                                       self.par["psoil"], self.soil))  # call 4SAIL from the SAIL instance
 
         return self.sail
 
@@ -125,55 +155,47 @@ class CallModel(nn.Module):
         tto_rad = self.par["tto"] * (math.pi / 180)
         psi_rad = self.par["psi"] * (math.pi / 180)
 
-        sail_instance = SAIL_v.Sail(tts_rad, tto_rad, psi_rad)
-
-        # Step 1: call Pro4sail to calculate understory reflectance
-        self.sail_understory_refl = sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2],
-                                                           self.par["LIDF"], self.par["typeLIDF"],
-                                                           self.par["LAIu"], self.par["hspot"],
-                                                           self.par["psoil"], self.soil)
-
-        # Step 2: call Pro4sail with understory as soil to calculate infinite crown reflectance
-        # vectorized: intialize extreme LAI ninputs times
-        inform_temp_LAI = torch.full(
-            (self.ninputs,), 15, dtype=torch.float32).T.to(self.device)
-        # vectorized: initialize hspot = 0 ninputs times
-        inform_temp_hspot = torch.full(
-            (self.ninputs,), 0, dtype=torch.float32).T.to(self.device)
-
-        self.sail_inf_refl = sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2],
-                                                    self.par["LIDF"], self.par["typeLIDF"],
-                                                    inform_temp_LAI, self.par["hspot"],
-                                                    psoil=None, soil=None, understory=self.sail_understory_refl)
-
-        self.sail_tts_trans = sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2],
-                                                     self.par["LIDF"], self.par["typeLIDF"],
-                                                     self.par["LAI"], inform_temp_hspot,
-                                                     psoil=None, soil=None, understory=self.sail_understory_refl,
-                                                     inform_trans='tts')
-
-        self.sail_tto_trans = sail_instance.pro4sail(self.prospect[:, :, 1], self.prospect[:, :, 2],
-                                                     self.par["LIDF"], self.par["typeLIDF"],
-                                                     self.par["LAI"], inform_temp_hspot,
-                                                     psoil=None, soil=None, understory=self.sail_understory_refl,
-                                                     inform_trans='tto')
-
-        inform_instance = INFORM_v.INFORM(
-            sail_instance.costts, sail_instance.costto, sail_instance.cospsi)
-
-        inform = inform_instance.inform(self.par["cd"], self.par["sd"], self.par["h"],
-                                        self.sail_understory_refl, self.sail_inf_refl,
-                                        self.sail_tts_trans, self.sail_tto_trans).clone().requires_grad_(True)  # ✅ Preserve gradients
+        sail_instance = SAIL_v.Sail(tts_rad, tto_rad, psi_rad, self.bands)
+
+        # Understory reflectance, infinite crown reflectance and crown transmittances for tts and tto
+        # from one fused SAIL evaluation
+        (self.sail_understory_refl, self.sail_inf_refl,
+         self.sail_tts_trans, self.sail_tto_trans) = sail_instance.inform4sail(self.prospect[:, :, 1], self.prospect[:, :, 2],
+                                                                               self.par["LIDF"], self.par["typeLIDF"],
+                                                                               self.par["LAI"], self.par["LAIu"],
+                                                                               self.par["hspot"], self.par["psoil"],
+                                                                               self.soil)
+
+        inform_instance = INFORM_v.INFORM(tts_rad, tto_rad, psi_rad)
+
+        inform = self.output(inform_instance.inform(self.par["cd"], self.par["sd"], self.par["h"],
+                                                    self.sail_understory_refl, self.sail_inf_refl,
+                                                    self.sail_tts_trans, self.sail_tto_trans))
 
         return inform
 
 # The class "Init_Model" initializes the models
 
 
+# Peak number of float32 spectra (2101 bands) alive per sample in run_model, measured with prospectPro (the other
+# PROSPECT versions differ by less than 5%): (without autograd, with autograd including the backward pass)
+ARRAYS_PER_SAMPLE = {'None': (30, 70), 'sail': (46, 270), 'inform': (50, 570)}
+
+
 class InitModel:
 
     # __init__ contains default values, but it is recommended to provide actual values for it
-    def __init__(self, lop="prospectD", canopy_arch=None, int_boost=1, nodat=-999, s2s="default"):
+    # max_memory: bytes available to one run of the model; larger batches are split into chunks (None: no limit)
+    # wavelengths: spectral window the model is restricted to, see spectral_window (None: 400-2500 nm)
+    # cache: rtm_torch.rtm_cache.RTMCache memoizing the spectra of runs without gradients (None: no caching)
+    # inference: run under torch.inference_mode without the gradient-preserving clones, for LUTs and evaluation;
+    #            the spectra cannot be used in autograd (False: gradients flow back to the parameters)
+    # dtype: floating point type of the whole chain; parameters, soil and leaf optics are cast to it and all tables
+    #        and intermediates follow (torch.float32 for speed, torch.float64 as reference, see dtype_deviation)
+    # soil_library: SoilLibrary of basis soil spectra; samples with the parameter 'soil_index' (n,) or
+    #               'soil_weights' (n, n_soils) get the mixed background instead of psoil (see soil_library.py)
+    def __init__(self, lop="prospectD", canopy_arch=None, int_boost=1, nodat=-999, s2s="default", max_memory=None,
+                 wavelengths=None, cache=None, inference=False, dtype=torch.float32, soil_library=None):
         # self._dir = os.path.dirname(os.path.realpath(
         #     __file__))  # get current directory
         # os.chdir(self._dir)  # change into current directory
@@ -182,39 +204,76 @@ class InitModel:
         # boost [0...1] of PROSAIL, e.g. int_boos = 10000 -> [0...10000] (EnMAP-default!)
         self.int_boost = int_boost
         self.nodat = nodat
-        # which sensor type? Default = Prosail out; "EnMAP", "Sentinel2", "Landsat8" etc.
+        # which sensor type? Default = Prosail out; "EnMAP", "Sentinel2", "Landsat8" etc. or a list of sensors
         self.s2s = s2s
         # "sort" (LUT contains multiple geos) vs. "no geo" (LUT contains ONE Geo)
         self.geo_mode = None
         self.soil = None  # initialize empty
+        self.max_memory = max_memory
+        self.cache = cache
+        self.inference = inference
+        self.dtype = dtype
+        self.soil_library = soil_library
 
         # List of names of all parameters in order in which they are written into the LUT; serves as labels for output
         self.para_names = ["N", "cab", "car", "anth", "cbrown", "cw", "cm", "cp", "cbc",
                            "LAI", "typeLIDF", "LIDF", "hspot", "psoil", "tts", "tto",
                            "psi", "LAIu", "cd", "sd", "h"]
 
-        # Initialize the spectrum to sensor conversion if a sensor is chosen
-        if self.s2s != "default":
+        # Initialize the spectrum to sensor conversion if a sensor is chosen; with a list of sensors, the leaf and
+        # canopy models run once and run_model returns a dictionary sensor -> spectra (see MultiSpec2Sensor)
+        self.multi_sensor = isinstance(s2s, (list, tuple))
+        if self.multi_sensor:
+            self.s2s_I = MultiSpec2Sensor(sensors=self.s2s, nodat=self.nodat)
+            sensor_init_success = self.s2s_I.init_sensor()
+            if not sensor_init_success:
+                raise Exception(
+                    "Could not convert spectra to sensor resolution!")
+        elif self.s2s != "default":
             self.s2s_I = Spec2Sensor(sensor=self.s2s, nodat=self.nodat)
             sensor_init_success = self.s2s_I.init_sensor()
             if not sensor_init_success:
                 raise Exception(
                     "Could not convert spectra to sensor resolution!")
 
+        # indices of the modelled wavelengths in lambd; the coefficient tables are sliced to them once
+        self.bands = self.spectral_window(wavelengths)
+        self.wl = lambd if self.bands is None else lambd[list(self.bands)]
+        if self.s2s != "default" and self.bands is not None:
+            self.s2s_I.set_wavelengths(torch.from_numpy(self.wl))
+
         self.device = torch.device(
             "cuda" if torch.cuda.is_available() else "cpu")
 
+    def spectral_window(self, wavelengths):
+        """
+        Returns the indices of the wavelengths to be modelled as a tuple (None for all of 400-2500 nm).
+        wavelengths: (min, max) range in nm, boolean mask over 400-2500 nm, sequence of wavelengths in nm,
+                     or 'sensor' for the wavelengths used by the spectral response functions of self.s2s
+        Wavelengths of a sensor that lie outside the window are ignored by its spectral response functions.
+        """
+        if wavelengths is None:
+            return None
+        if isinstance(wavelengths, str):
+            if wavelengths != 'sensor' or self.s2s == "default":
+                raise ValueError("wavelengths='sensor' requires a sensor (s2s)")
+            wl = self.s2s_I.srf_wavelengths()
+        elif isinstance(wavelengths, tuple) and len(wavelengths) == 2:
+            wl = range(int(math.ceil(wavelengths[0])), int(wavelengths[1]) + 1)
+        else:
+            wavelengths = np.asarray(wavelengths)
+            wl = lambd[wavelengths] if wavelengths.dtype == bool else wavelengths.astype(int)
+
+        bands = tuple(sorted({int(w) - lambd[0] for w in wl if lambd[0] <= w <= lambd[-1]}))
+        if not bands:
+            raise ValueError("The spectral window contains no wavelength within 400-2500 nm")
+        return bands
+
     def initialize_multiple_simple(self, soil=None, **paras):
-        # simple tests for vectorized versions
+        # simple tests for vectorized versions; parameters of any shape that broadcast to the batch size (e.g. 0-d)
         self.soil = soil
-        nparas = len(paras['LAI'])
-        para_grid = torch.empty(
-            (nparas, len(paras.keys())), dtype=torch.float32).to(self.device)
-        for run in range(nparas):
-            for ikey, key in enumerate(self.para_names):
-                para_grid[run, ikey] = paras[key][run]
-
-        return self.run_model(paras=dict(zip(self.para_names, para_grid.T)))
+        return self.run_model(paras={key: torch.as_tensor(paras[key], dtype=self.dtype, device=self.device)
+                                     for key in self.para_names})
 
     def initialize_single(self, soil=None, **paras):
         # Initialize a single run of PROSAIL (simplification for building of para_grid)
@@ -228,29 +287,140 @@ class InitModel:
 
         # shape 1 for single run
         # TODO para_grid also needs to be put on device
-        para_grid = torch.empty((1, len(paras.keys()))).to(self.device)
+        para_grid = torch.empty((1, len(paras.keys())), dtype=self.dtype).to(self.device)
         for ikey, key in enumerate(self.para_names):
             para_grid[0, ikey] = paras[key]
         return self.run_model(paras=dict(zip(self.para_names, para_grid.T)))
 
-    def run_model(self, paras):
+    def bytes_per_sample(self, grad=False):
+        # estimated peak memory of one sample in run_model, with or without the autograd graph
+        itemsize = torch.finfo(self.dtype).bits // 8
+        return itemsize * len(self.wl) * ARRAYS_PER_SAMPLE[str(self.canopy_arch)][int(grad)]
+
+    def chunk_size(self, grad=False):
+        if self.max_memory is None:
+            return None
+        return max(1, int(self.max_memory // self.bytes_per_sample(grad)))
+
+    def run_model(self, paras, split=True):
+        # split: with several sensors, a dictionary sensor -> spectra (False: their bands side by side, (n, n_bands))
+        if self.inference:
+            with torch.inference_mode():
+                result = self._run_cached(paras)
+        else:
+            result = self._run_cached(paras)
+        # bands of all sensors are stacked internally (chunks, cache)
+        return self.s2s_I.split(result) if self.multi_sensor and split else result
+
+    def _run_cached(self, paras):
+        # Execution of PROSAIL, taken from self.cache where possible
+        grad = torch.is_grad_enabled() and any(v.requires_grad for v in paras.values())
+        if self.cache is not None:
+            if not grad:
+                return self.cache.run(self, paras)
+            self.cache.bypassed += 1
+        return self.run_chunked(paras, grad)
+
+    def run_chunked(self, paras, grad=False):
+        # Execution of PROSAIL, split into chunks if the batch does not fit into self.max_memory
+        n = batch_size(paras)
+        chunk_size = self.chunk_size(grad)
+        if chunk_size is None or n <= chunk_size:
+            return self._run_model(paras)
+
+        if 'soil' not in paras and self.batched_soil(n):
+            # a background spectrum per sample is split like the parameters and, as a chunk input, recomputed
+            # with them by checkpoint
+            paras = dict(paras, soil=self.soil)
+        keys = list(paras.keys())
+        results = []
+        for start in range(0, n, chunk_size):
+            # per-sample parameters are split along the first axis (soil_weights and soil have a second one)
+            chunk = [v[start:start + chunk_size] if v.dim() and v.shape[0] == n else v for v in paras.values()]
+            if grad:
+                # only the chunk inputs are kept, the graph of a chunk is recomputed during the backward pass
+                results.append(checkpoint(lambda *values: self._run_model(dict(zip(keys, values))), *chunk,
+                                          use_reentrant=False))
+            else:
+                results.append(self._run_model(dict(zip(keys, chunk))))
+        return torch.cat(results)
+
+    def batched_soil(self, n):
+        # True if self.soil holds one background spectrum per sample of a batch of n samples
+        return isinstance(self.soil, torch.Tensor) and self.soil.dim() == 2 and self.soil.shape[0] == n
+
+    def _run_model(self, paras, leaf=None):
         # Execution of PROSAIL
-        # Create new instance of CallModel
-        i_model = CallModel(soil=self.soil, paras=paras)
+        result = self.simulate(paras, leaf)
+        if result is None or self.s2s == "default":
+            return result
+        else:
+            # if a sensor is chosen, run the Spectral Response Function now
+            return self.s2s_I.run_srf(result)
 
+    def _call_model(self, paras):
+        # new instance of CallModel with parameters and soil in self.dtype
+        # paras may contain 'soil', the rows of a per-sample self.soil that belong to these samples (chunks, cache)
+        paras = {k: v.to(self.dtype) if isinstance(v, torch.Tensor) else torch.tensor(v, dtype=self.dtype)
+                 for k, v in paras.items()}
+        weights, index = paras.pop('soil_weights', None), paras.pop('soil_index', None)
+        soil = paras.pop('soil', self.soil)
+        if weights is not None or index is not None:
+            if self.soil_library is None:
+                raise ValueError("The parameters 'soil_index' and 'soil_weights' require a soil_library")
+            # background of the whole batch from the soil library, mixed once for all SAIL runs
+            soil = self.soil_library.mix(weights=weights, index=index, bands=self.bands, dtype=self.dtype)
+        elif isinstance(soil, torch.Tensor):
+            soil = soil.to(self.dtype)
+        return CallModel(soil=soil, paras=paras, bands=self.bands, inference=self.inference)
+
+    def dtype_deviation(self, paras, reference=torch.float64):
+        """
+        Validation of self.dtype: runs paras in self.dtype and in reference and returns the maximum absolute and
+        relative deviation per output band (n_bands,) together with the wavelengths of the bands
+        """
+        twin = copy.copy(self)
+        twin.dtype, twin.cache = reference, None
+        with torch.no_grad():
+            result = self._run_cached(paras).to(reference)
+            expected = twin._run_cached(paras)
+        deviation = (result - expected).abs()
+        wavelengths = self.wl.tolist() if self.s2s == "default" else self.s2s_I.wl_sensor.tolist()
+        return {'wavelengths': wavelengths, 'max_abs': deviation.max(dim=0).values,
+                'max_rel': (deviation / expected.abs().clamp(min=1e-6)).max(dim=0).values}
+
+    def leaf_optics(self, paras):
+        # Output of the leaf model (n, n_wl, 3): wavelengths, reflectance and transmittance
+        i_model = self._call_model(paras)
+        if self._call_leaf_model(i_model):
+            return i_model.prospect
+
+    def _call_leaf_model(self, i_model):
         # 1: Call one of the Prospect-Versions
         if self.lop == "prospect4":
-            i_model.call_prospect4().to(device)
+            i_model.call_prospect4()
         elif self.lop == "prospect5":
-            i_model.call_prospect5().to(device)
+            i_model.call_prospect5()
         elif self.lop == "prospect5B":
-            i_model.call_prospect5b().to(device)
+            i_model.call_prospect5b()
         elif self.lop == "prospectD":
-            i_model.call_prospectD().to(device)
+            i_model.call_prospectD()
         elif self.lop == "prospectPro":
-            i_model.call_prospectPro().to(device)
+            i_model.call_prospectPro()
         else:
             print("Unknown Prospect version. Try 'prospect4', 'prospect5', 'prospect5B' or 'prospectD' or ProspectPro")
+            return False
+        return True
+
+    def simulate(self, paras, leaf=None):
+        # Leaf and canopy model at the modelled wavelengths (self.wl), without the spectral response functions
+        # leaf: output of leaf_optics for the same samples, the leaf model is not run again
+        # Create new instance of CallModel
+        i_model = self._call_model(paras)
+
+        if leaf is not None:
+            i_model.prospect = leaf.to(self.dtype)
+        elif not self._call_leaf_model(i_model):
             return
 
         # 2: If chosen, call one of the SAIL-versions and multiply with self.int_boost
@@ -261,8 +431,4 @@ class InitModel:
         else:
             result = i_model.prospect[:, :, 1] * self.int_boost
 
-        if self.s2s == "default":
-            return result
-        else:
-            # if a sensor is chosen, run the Spectral Response Function now
-            return self.s2s_I.run_srf(result)
+        return result
@@ -22,326 +22,162 @@ Jacquemoud S., & Baret F. (1990): PROSPECT: a model of leaf optical properties s
 '''
 
 import torch
-from rtm_torch.Resources.PROSAIL.dataSpec import *
-from rtm_torch.Resources.special import exp1
+from torch.autograd import Function
+from rtm_torch.Resources.PROSAIL.dataSpec import lambd, tables
+from rtm_torch.Resources.special import exp1, exporting
+
+# absorption coefficient used in place of k = 0, where E1 is infinite; representable in float32 and float64, so both
+# dtypes replace k = 0 by the same value
+K_ZERO = 2.220446049250313e-16
+
+
+def plate_model(k, N, t12, tav90n, n):
+    # Reflectance RN and transmittance TN of N layers from the absorption coefficient k (all Prospect versions)
+
+    # without a data-dependent branch, so the model can be traced (see rtm_module)
+    k = k.masked_fill(k == 0, K_ZERO)
+    trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
+    trans2 = trans ** 2
+
+    # t12, tav90n are calculated once and are listed in dataSpec
+    # t12 is tav(40, n); tav90n is tav(90, n)
+    t21 = tav90n / (n ** 2)
+    r12 = 1 - t12
+    r21 = 1 - t21
+    r21_2 = r21 ** 2
+    x = t12 / tav90n
+    y = x * (tav90n - 1) + 1 - t12
+
+    # reflectance and transmittance of the elementary layer N = 1
+    ra = r12 + ((t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
+    ta = ((t12 * t21) * trans) / (1 - (r21_2) * (trans2))
+    r90 = (ra - y) / x
+    t90 = ta / x
+
+    # reflectance and transmittance of N layers
+    t90_2 = t90 ** 2
+    r90_2 = r90 ** 2
+
+    delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
+    beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
+    va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
+
+    vb = k.new_zeros(k.shape)
+
+    ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta - r90) <= 1e-14)
+    ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta - r90) > 1e-14)
+    vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
+                                                  (va[ind_vb_le_row, ind_vb_le_col] - r90[
+                                                      ind_vb_le_row, ind_vb_le_col]) / 1e-14)
+    vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
+                                                  (va[ind_vb_gt_row, ind_vb_gt_col] - r90[
+                                                      ind_vb_gt_row, ind_vb_gt_col]) /
+                                                  (va[ind_vb_gt_row, ind_vb_gt_col] *
+                                                   (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[
+                                                       ind_vb_gt_row, ind_vb_gt_col])))
+
+    vbNN = vb ** ((N - 1).unsqueeze(-1))
+    vbNNinv = 1 / vbNN
+    vainv = 1 / va
+    s1 = ta * t90 * (vbNN - vbNNinv)
+    s2 = ta * (va - vainv)
+    s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
+
+    RN = ra + s1 / s3
+    TN = s2 / s3
+    return RN, TN
+
+
+class PlateModel(Function):
+    """
+    plate_model with a recompute-based backward: only the inputs (k, N and the tables) are saved, the ~30
+    intermediates of shape (n, n_wl) are recomputed in backward instead of being kept by autograd between the
+    forward and the backward pass
+    """
+    @staticmethod
+    def forward(ctx, k, N, t12, tav90n, n):
+        ctx.save_for_backward(k, N, t12, tav90n, n)
+        return plate_model(k, N, t12, tav90n, n)
+
+    @staticmethod
+    def backward(ctx, grad_RN, grad_TN):
+        k, N, t12, tav90n, n = ctx.saved_tensors
+        needed = ctx.needs_input_grad[:2]
+        with torch.enable_grad():
+            k = k.detach().requires_grad_(needed[0])
+            N = N.detach().requires_grad_(needed[1])
+            RN, TN = plate_model(k, N, t12, tav90n, n)
+            inputs = [x for x, need in zip((k, N), needed) if need]
+            grads = iter(torch.autograd.grad((RN, TN), inputs, (grad_RN, grad_TN), allow_unused=True))
+        return tuple(next(grads) if need else None for need in needed) + (None, None, None)
 
-device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
 class Prospect:
 
     nlambd = len(lambd)
 
+    def __init__(self, bands=None, recompute=True):
+        # bands: indices of the wavelengths (400-2500 nm) to be modelled, None for all
+        # recompute: backward of the plate model by recomputation (PlateModel) instead of stored intermediates
+        self.bands = bands
+        self.recompute = recompute
+
+    def plate(self, k, N, t):
+        if self.recompute and torch.is_grad_enabled() and (k.requires_grad or N.requires_grad) and not exporting():
+            return PlateModel.apply(k, N, t['t12'], t['tav90n'], t['refractive'])
+        return plate_model(k, N, t['t12'], t['tav90n'], t['refractive'])
+
     def prospect_Pro(self, N, Cab, Car, Anth, Cp, Cbc, Cbrown, Cw):  # Does not contain Cm
 
-        n = Ppro_refractive
-        k = (torch.outer(Cab, Ppro_k_Cab) + torch.outer(Car, Ppro_k_Ccx) + torch.outer(Anth, Ppro_k_Canth) +
-             # torch.outer(Cm, Ppro_k_Cm)
-             torch.outer(Cbrown, Ppro_k_Cbrown) + torch.outer(Cw, Ppro_k_Cw) +
-             torch.outer(Cp, Ppro_k_Cp) + torch.outer(Cbc, Ppro_k_Cbc)) / N.unsqueeze(-1)
-
-        ind_k0_row, ind_k0_col = torch.where(k == 0)  # Vectorize = 2D
-
-        if len(ind_k0_row) > 0:
-            k[ind_k0_row, ind_k0_col] = torch.finfo(float).eps
-        # convert to numpy because exp1 doesn't exist in PyTorch
-        trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
-        trans2 = trans ** 2
-
-        # t12, tav90n are calculated once and are listed in dataSpec
-        # t12 is tav(40, n); tav90n is tav(90, n)
-        t21 = Ppro_tav90n / (n ** 2)
-        r12 = 1 - Ppro_t12
-        r21 = 1 - t21
-        r21_2 = r21 ** 2
-        x = Ppro_t12 / Ppro_tav90n
-        y = x * (Ppro_tav90n - 1) + 1 - Ppro_t12
-
-        # reflectance and transmittance of the elementary layer N = 1
-        ra = r12 + ((Ppro_t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
-        ta = ((Ppro_t12 * t21) * trans) / (1 - (r21_2) * (trans2))
-        r90 = (ra - y) / x
-        t90 = ta / x
-
-        # reflectance and transmittance of N layers
-        t90_2 = t90 ** 2
-        r90_2 = r90 ** 2
-
-        delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
-        beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
-        va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
-
-        vb = torch.zeros((Cab.shape[0], self.nlambd)).to(device)
-
-        ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta - r90) <= 1e-14)
-        ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta - r90) > 1e-14)
-        vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
-                                                      (va[ind_vb_le_row, ind_vb_le_col] - r90[
-                                                          ind_vb_le_row, ind_vb_le_col]) / 1e-14)
-        vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] - r90[
-                                                          ind_vb_gt_row, ind_vb_gt_col]) /
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] *
-                                                       (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[
-                                                           ind_vb_gt_row, ind_vb_gt_col])))
-
-        vbNN = vb ** ((N - 1).unsqueeze(-1))
-        vbNNinv = 1 / vbNN
-        vainv = 1 / va
-        s1 = ta * t90 * (vbNN - vbNNinv)
-        s2 = ta * (va - vainv)
-        s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
-
-        RN = ra + s1 / s3
-        TN = s2 / s3
-        LRT = torch.zeros((Cab.shape[0], self.nlambd, 3))
-        LRT[:, :, 0] = lambd.unsqueeze(0)
-        LRT[:, :, 1] = RN
-        LRT[:, :, 2] = TN
+        t = tables('prospectPro', N.device, N.dtype, self.bands)
+        k = (torch.outer(Cab, t['k_Cab']) + torch.outer(Car, t['k_Ccx']) + torch.outer(Anth, t['k_Canth']) +
+             # torch.outer(Cm, t['k_Cm'])
+             torch.outer(Cbrown, t['k_Cbrown']) + torch.outer(Cw, t['k_Cw']) +
+             torch.outer(Cp, t['k_Cp']) + torch.outer(Cbc, t['k_Cbc'])) / N.unsqueeze(-1)
+
+        RN, TN = self.plate(k, N, t)
+        LRT = torch.stack((tables('lambd', N.device, N.dtype, self.bands)['lambd'].expand_as(RN), RN, TN), dim=-1)
 
         return LRT
 
     def prospect_D(self, N, Cab, Car, Anth, Cbrown, Cw, Cm):
-        n = PD_refractive
+        t = tables('prospectD', N.device, N.dtype, self.bands)
         # NOTE if N is a zero tensor, the result of k is inf
-        k = (torch.outer(Cab, PD_k_Cab) + torch.outer(Car, PD_k_Car) + torch.outer(Anth, PD_k_Anth) +
-             torch.outer(Cbrown, PD_k_Brown) + torch.outer(Cw, PD_k_Cw) + torch.outer(Cm, PD_k_Cm)) / N.unsqueeze(-1)
-
-        ind_k0_row, ind_k0_col = torch.where(k == 0)  # Vectorize = 2D
-
-        if len(ind_k0_row) > 0:
-            k[ind_k0_row, ind_k0_col] = torch.finfo(float).eps
-        trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
-        trans2 = trans ** 2
-
-        # t12, tav90n are calculated once and are listet in dataSpec
-        # t12 is tav(40, n); tav90n is tav(90, n)
-        t21 = PD_tav90n / (n ** 2)
-        r12 = 1 - PD_t12
-        r21 = 1 - t21
-        r21_2 = r21 ** 2
-        x = PD_t12 / PD_tav90n
-        y = x * (PD_tav90n - 1) + 1 - PD_t12
-
-        # reflectance and transmittance of the elementary layer N = 1
-        ra = r12 + ((PD_t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
-        ta = ((PD_t12 * t21) * trans) / (1 - (r21_2) * (trans2))
-        r90 = (ra - y) / x
-        t90 = ta / x
-
-        # reflectance and transmittance of N layers
-        t90_2 = t90 ** 2
-        r90_2 = r90 ** 2
-
-        delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
-        beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
-        va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
-
-        vb = torch.zeros((Cab.shape[0], self.nlambd)).to(device)
-
-        ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta-r90) <= 1e-14)
-        ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta-r90) > 1e-14)
-        vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
-                                                      (va[ind_vb_le_row, ind_vb_le_col] - r90[ind_vb_le_row, ind_vb_le_col]) / 1e-14)
-        vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col]) /
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] *
-                                                       (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col])))
-
-        vbNN = vb ** ((N - 1).unsqueeze(-1))
-        vbNNinv = 1 / vbNN
-        vainv = 1 / va
-        s1 = ta * t90 * (vbNN - vbNNinv)
-        s2 = ta * (va - vainv)
-        s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
-
-        RN = ra + s1 / s3
-        TN = s2 / s3
-        LRT = torch.zeros((Cab.shape[0], self.nlambd, 3))
-        LRT[:, :, 0] = lambd.unsqueeze(0)
-        LRT[:, :, 1] = RN
-        LRT[:, :, 2] = TN
+        k = (torch.outer(Cab, t['k_Cab']) + torch.outer(Car, t['k_Car']) + torch.outer(Anth, t['k_Anth']) +
+             torch.outer(Cbrown, t['k_Brown']) + torch.outer(Cw, t['k_Cw']) + torch.outer(Cm, t['k_Cm'])) / N.unsqueeze(-1)
+
+        RN, TN = self.plate(k, N, t)
+        LRT = torch.stack((tables('lambd', N.device, N.dtype, self.bands)['lambd'].expand_as(RN), RN, TN), dim=-1)
 
         return LRT
 
     def prospect_5(self, N, Cab, Car, Cw, Cm):
-        n = P5_refractive
-        k = (torch.outer(Cab, P5_k_Cab) + torch.outer(Car, P5_k_Car) +
-             torch.outer(Cw, P5_k_Cw) + torch.outer(Cm, P5_k_Cm)) / N.unsqueeze(-1)
-
-        ind_k0_row, ind_k0_col = torch.where(k == 0)  # Vectorize = 2D
-
-        if len(ind_k0_row) > 0:
-            k[ind_k0_row, ind_k0_col] = torch.finfo(float).eps
-        trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
-        trans2 = trans ** 2
-
-        t21 = P5_tav90n / (n ** 2)
-        r12 = 1 - P5_t12
-        r21 = 1 - t21
-        r21_2 = r21 ** 2
-        x = P5_t12 / P5_tav90n
-        y = x * (P5_tav90n - 1) + 1 - P5_t12
-
-        ra = r12 + ((P5_t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
-        ta = ((P5_t12 * t21) * trans) / (1 - (r21_2) * (trans2))
-        r90 = (ra - y) / x
-        t90 = ta / x
-
-        t90_2 = t90 ** 2
-        r90_2 = r90 ** 2
-
-        delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
-        beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
-        va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
-
-        vb = torch.zeros((Cab.shape[0], self.nlambd)).to(device)
-
-        ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta - r90) <= 1e-14)
-        ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta - r90) > 1e-14)
-        vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
-                                                      (va[ind_vb_le_row, ind_vb_le_col] - r90[ind_vb_le_row, ind_vb_le_col]) / 1e-14)
-        vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col]) /
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] *
-                                                       (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col])))
-
-        vbNN = vb ** ((N - 1).unsqueeze(-1))
-        vbNNinv = 1 / vbNN
-        vainv = 1 / va
-        s1 = ta * t90 * (vbNN - vbNNinv)
-        s2 = ta * (va - vainv)
-        s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
-
-        RN = ra + s1 / s3
-        TN = s2 / s3
-        LRT = torch.zeros((Cab.shape[0], self.nlambd, 3))
-        LRT[:, :, 0] = lambd.unsqueeze(0)
-        LRT[:, :, 1] = RN
-        LRT[:, :, 2] = TN
+        t = tables('prospect5', N.device, N.dtype, self.bands)
+        k = (torch.outer(Cab, t['k_Cab']) + torch.outer(Car, t['k_Car']) +
+             torch.outer(Cw, t['k_Cw']) + torch.outer(Cm, t['k_Cm'])) / N.unsqueeze(-1)
+
+        RN, TN = self.plate(k, N, t)
+        LRT = torch.stack((tables('lambd', N.device, N.dtype, self.bands)['lambd'].expand_as(RN), RN, TN), dim=-1)
 
         return LRT
 
     def prospect_5B(self, N, Cab, Car, Cbrown, Cw, Cm):
 
-        n = P5_refractive
-        k = (torch.outer(Cab, P5_k_Cab) + torch.outer(Car, P5_k_Car) +
-             torch.outer(Cbrown, P5_k_Brown) + torch.outer(Cw, P5_k_Cw) + torch.outer(Cm, P5_k_Cm)) / N.unsqueeze(-1)
-
-        ind_k0_row, ind_k0_col = torch.where(k == 0)  # Vectorize = 2D
-
-        if len(ind_k0_row) > 0:
-            k[ind_k0_row, ind_k0_col] = torch.finfo(float).eps
-        # Using torch.exp(-k) / k as approximation of exp1(k)
-        trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
-        trans2 = trans ** 2
-
-        # t12, tav90n are calculated once and are listed in dataSpec
-        # t12 is tav(40, n); tav90n is tav(90, n)
-        t21 = P5_tav90n / (n ** 2)
-        r12 = 1 - P5_t12
-        r21 = 1 - t21
-        r21_2 = r21 ** 2
-        x = P5_t12 / P5_tav90n
-        y = x * (P5_tav90n - 1) + 1 - P5_t12
-
-        # reflectance and transmittance of the elementary layer N = 1
-        ra = r12 + ((P5_t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
-        ta = ((P5_t12 * t21) * trans) / (1 - (r21_2) * (trans2))
-        r90 = (ra - y) / x
-        t90 = ta / x
-
-        # reflectance and transmittance of N layers
-        t90_2 = t90 ** 2
-        r90_2 = r90 ** 2
-
-        delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
-        beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
-        va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
-
-        vb = torch.zeros((Cab.shape[0], self.nlambd)).to(device)
-
-        ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta - r90) <= 1e-14)
-        ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta - r90) > 1e-14)
-        vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
-                                                      (va[ind_vb_le_row, ind_vb_le_col] - r90[ind_vb_le_row, ind_vb_le_col]) / (1e-14))
-        vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col]) /
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] * (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col])))
-
-        vbNN = vb ** ((N - 1).unsqueeze(-1))
-        vbNNinv = 1 / vbNN
-        vainv = 1 / va
-        s1 = ta * t90 * (vbNN - vbNNinv)
-        s2 = ta * (va - vainv)
-        s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
-
-        RN = ra + s1 / s3
-        TN = s2 / s3
-        LRT = torch.zeros((Cab.shape[0], self.nlambd, 3))
-        LRT[:, :, 0] = lambd.unsqueeze(0)
-        LRT[:, :, 1] = RN
-        LRT[:, :, 2] = TN
+        t = tables('prospect5B', N.device, N.dtype, self.bands)
+        k = (torch.outer(Cab, t['k_Cab']) + torch.outer(Car, t['k_Car']) +
+             torch.outer(Cbrown, t['k_Brown']) + torch.outer(Cw, t['k_Cw']) + torch.outer(Cm, t['k_Cm'])) / N.unsqueeze(-1)
+
+        RN, TN = self.plate(k, N, t)
+        LRT = torch.stack((tables('lambd', N.device, N.dtype, self.bands)['lambd'].expand_as(RN), RN, TN), dim=-1)
 
         return LRT
 
     def prospect_4(self, N, Cab, Cw, Cm):
-        n = P4_refractive
-        k = (torch.outer(Cab, P4_k_Cab) + torch.outer(Cw, P4_k_Cw) +
-             torch.outer(Cm, P4_k_Cm)) / N.unsqueeze(-1)
-
-        ind_k0_row, ind_k0_col = torch.where(k == 0)  # Vectorize = 2D
-
-        if len(ind_k0_row) > 0:
-            k[ind_k0_row, ind_k0_col] = torch.finfo(float).eps
-        trans = (1 - k) * torch.exp(-k) + (k ** 2) * exp1(k)
-        trans2 = trans ** 2
-
-        # t12, tav90n are calculated once and are listed in dataSpec
-        # t12 is tav(40, n); tav90n is tav(90, n)
-        t21 = P4_tav90n / (n ** 2)
-        r12 = 1 - P4_t12
-        r21 = 1 - t21
-        r21_2 = r21 ** 2
-        x = P4_t12 / P4_tav90n
-        y = x * (P4_tav90n - 1) + 1 - P4_t12
-
-        # reflectance and transmittance of the elementary layer N = 1
-        ra = r12 + ((P4_t12 * t21 * r21) * trans2) / (1 - (r21_2) * (trans2))
-        ta = ((P4_t12 * t21) * trans) / (1 - (r21_2) * (trans2))
-        r90 = (ra - y) / x
-        t90 = ta / x
-
-        # reflectance and transmittance of N layers
-        t90_2 = t90 ** 2
-        r90_2 = r90 ** 2
-
-        delta = torch.sqrt((t90_2 - r90_2 - 1) ** 2 - 4 * r90_2)
-        beta = (1 + r90_2 - t90_2 - delta) / (2 * r90)
-        va = (1 + r90_2 - t90_2 + delta) / (2 * r90)
-
-        vb = torch.zeros((Cab.shape[0], self.nlambd))
-
-        ind_vb_le_row, ind_vb_le_col = torch.where(va * (beta - r90) <= 1e-14)
-        ind_vb_gt_row, ind_vb_gt_col = torch.where(va * (beta - r90) > 1e-14)
-        vb[ind_vb_le_row, ind_vb_le_col] = torch.sqrt(beta[ind_vb_le_row, ind_vb_le_col] *
-                                                      (va[ind_vb_le_row, ind_vb_le_col] - r90[ind_vb_le_row, ind_vb_le_col]) / (1e-14))
-        vb[ind_vb_gt_row, ind_vb_gt_col] = torch.sqrt(beta[ind_vb_gt_row, ind_vb_gt_col] *
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col]) /
-                                                      (va[ind_vb_gt_row, ind_vb_gt_col] *
-                                                       (beta[ind_vb_gt_row, ind_vb_gt_col] - r90[ind_vb_gt_row, ind_vb_gt_col])))
-
-        vbNN = vb ** ((N - 1).unsqueeze(-1))
-        vbNNinv = 1 / vbNN
-        vainv = 1 / va
-        s1 = ta * t90 * (vbNN - vbNNinv)
-        s2 = ta * (va - vainv)
-        s3 = va * vbNN - vainv * vbNNinv - r90 * (vbNN - vbNNinv)
-
-        RN = ra + s1 / s3
-        TN = s2 / s3
-        LRT = torch.zeros((Cab.shape[0], self.nlambd, 3))
-        LRT[:, :, 0] = lambd.unsqueeze(0)
-        LRT[:, :, 1] = RN
-        LRT[:, :, 2] = TN
+        t = tables('prospect4', N.device, N.dtype, self.bands)
+        k = (torch.outer(Cab, t['k_Cab']) + torch.outer(Cw, t['k_Cw']) +
+             torch.outer(Cm, t['k_Cm'])) / N.unsqueeze(-1)
+
+        RN, TN = self.plate(k, N, t)
+        LRT = torch.stack((tables('lambd', N.device, N.dtype, self.bands)['lambd'].expand_as(RN), RN, TN), dim=-1)
 
         return LRT
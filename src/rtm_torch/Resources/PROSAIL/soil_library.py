@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+'''
+soil_library.py - library of basis soil spectra and the per-sample mixing of the background of SAIL/INFORM
+
+By default the background of SAIL is the mixture psoil * Rsoil1 + (1 - psoil) * Rsoil2 of the dry and wet soil
+spectra of dataSpec. A SoilLibrary holds any number of basis spectra (n_soils, 2101) and mixes them for a whole
+batch at once, either by index (one basis spectrum per sample) or by weights (n, n_soils) as one matrix product:
+
+    library = SoilLibrary.load('soils.npz')              # or SoilLibrary.default(): ['dry', 'wet']
+    model = InitModel(lop='prospectPro', canopy_arch='inform', soil_library=library)
+    spectra = model.run_model(dict(paras, soil_index=index))          # index: (n,)
+    spectra = model.run_model(dict(paras, soil_weights=weights))      # weights: (n, n_soils)
+
+The mixed soil is computed once per batch (chunk) by InitModel and used as the background of all SAIL runs,
+including the four runs of INFORM; psoil is ignored for these samples.
+'''
+import numpy as np
+import torch
+from rtm_torch.Resources.PROSAIL.dataSpec import lambd, tables
+
+
+class SoilLibrary:
+
+    def __init__(self, spectra, names=None):
+        """
+        spectra:    basis soil reflectances (n_soils, 2101) at 400-2500 nm
+        names:      name of every basis spectrum (default: soil0, soil1, ...)
+        """
+        self.spectra = np.asarray(spectra, dtype=np.float64)
+        if self.spectra.ndim != 2 or self.spectra.shape[1] != len(lambd):
+            raise ValueError("Soil spectra need the shape (n_soils, {})".format(len(lambd)))
+        self.names = list(names) if names is not None else ["soil{:d}".format(i) for i in range(len(self.spectra))]
+        # basis per (device, dtype, bands)
+        self._basis = {}
+
+    @classmethod
+    def default(cls):
+        # the dry and wet soil of the default background
+        spec = tables('canopy', dtype=torch.float64)
+        return cls(torch.stack((spec['Rsoil1'], spec['Rsoil2'])).numpy(), names=['dry', 'wet'])
+
+    @classmethod
+    def load(cls, path):
+        # .npz with the arrays 'spectra' and optionally 'names'
+        with np.load(path) as archive:
+            return cls(archive['spectra'], archive['names'].tolist() if 'names' in archive.files else None)
+
+    def save(self, path):
+        np.savez(path, spectra=self.spectra, names=np.array(self.names))
+
+    def __len__(self):
+        return len(self.spectra)
+
+    def basis(self, device='cpu', dtype=torch.float32, bands=None):
+        # basis spectra (n_soils, n_wl) restricted to bands, converted once per device and dtype
+        key = (torch.device(device), dtype, bands)
+        if key not in self._basis:
+            spectra = self.spectra if bands is None else self.spectra[:, list(bands)]
+            # not an inference tensor, the basis is shared with later runs that need gradients
+            with torch.inference_mode(False):
+                self._basis[key] = torch.from_numpy(spectra).to(device=key[0], dtype=dtype)
+        return self._basis[key]
+
+    def mix(self, weights=None, index=None, bands=None, device=None, dtype=None):
+        """
+        Background spectra (n, n_wl) of a batch: weights (n, n_soils) -> weights @ basis, or index (n,) -> one basis
+        spectrum per sample. Weights do not need to sum to 1, their sum scales the brightness.
+        """
+        ref = weights if weights is not None else index
+        device = ref.device if device is None else device
+        dtype = dtype or (weights.dtype if weights is not None else torch.float32)
+        basis = self.basis(device, dtype, bands)
+        if weights is not None:
+            return weights.to(dtype) @ basis
+        return basis[index.long()]
@@ -48,8 +48,20 @@ import torch
 import numpy as np
 import csv
 import os
+from rtm_torch.Resources.constants import ConstantRegistry
 
-device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+SRF_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'srf')
+
+
+def load_srf(sensor):
+    # the srf file is a numpy .npz; this file type contains more than one array and are addressed by name like
+    # dictionaries from the np.open object
+    with np.load(os.path.join(SRF_DIR, sensor + ".srf")) as srf_file:
+        return {key: srf_file[key] for key in ('srf', 'srf_nbands', 'sensor_wl', 'sensor_ndvi')}
+
+
+# SRF tables of each sensor, read once per process
+srf_registry = ConstantRegistry(load_srf)
 
 # Execution of a conversion between two sensors
 
@@ -58,82 +70,126 @@ class Spec2Sensor:
 
     def __init__(self, nodat, sensor):
         self.wl_sensor, self.fwhm = (None, None)
-        self.wl = torch.arange(400, 2501, device=device)
+        self.wl = torch.arange(400, 2501)
         self.n_wl = len(self.wl)
         self.nodat = nodat
         self.path = os.path.dirname(os.path.realpath(__file__))
         self.sensor = sensor
+        # srf_matrix per (device, dtype, int_factor_wl)
+        self._matrices = {}
 
     def init_sensor(self):
         # Initialize values for the sensor
         try:
-            srf_file = np.load(self.path + "/srf/" + self.sensor + ".srf")
+            srf_file = srf_registry.get(self.sensor, dtype=torch.float64)
         except FileNotFoundError:
             print("File {} not found, please check directories!".format(
                 self.sensor + ".srf"))
             return False
 
-        # the srf file is a numpy .npz; this file type contains more than one array and are addressed by name like
-        # dictionaries from the np.open object
-        # Convert the numpy arrays to PyTorch tensors
-        self.srf = torch.from_numpy(srf_file['srf']).to(device)
-        self.srf_nbands = torch.from_numpy(srf_file['srf_nbands']).to(device)
-        self.wl_sensor = torch.from_numpy(srf_file['sensor_wl']).to(device)
+        # the SRF tables stay on the CPU, they are only read element-wise while building the band weights
+        self.srf = srf_file['srf']
+        self.srf_nbands = srf_file['srf_nbands']
+        self.wl_sensor = srf_file['sensor_wl']
         self.n_wl_sensor = len(self.wl_sensor)
-        self.ndvi = torch.from_numpy(srf_file['sensor_ndvi']).to(device)
+        self.ndvi = srf_file['sensor_ndvi']
 
         return True  # return True if everything worked
 
+    def set_wavelengths(self, wl):
+        # wavelengths [nm] of the spectra passed to run_srf, e.g. the spectral window of InitModel
+        self.wl = torch.as_tensor(wl)
+        self.n_wl = len(self.wl)
+        self._matrices = {}
+
+    def srf_wavelengths(self, int_factor_wl=1000):
+        # set of the wavelengths [nm] that carry a weight in any band
+        srf, srf_nbands = self.srf.numpy(), self.srf_nbands.numpy()
+        return {int(srf[i, band, 0] * int_factor_wl)
+                for band in range(len(srf_nbands)) for i in range(srf_nbands[band])}
+
+    def srf_matrix(self, device='cpu', dtype=torch.float32, int_factor_wl=1000):
+        """
+        Spectral response functions as a dense matrix (n_wl, n_wl_sensor) of normalized weights, so that
+        reflectance @ matrix is the weighted average of each band, and a boolean mask (n_wl_sensor,) of the bands
+        that have at least one weight within self.wl (the other bands are set to nodat by run_srf).
+        Built once per device and dtype.
+        """
+        key = (torch.device(device), dtype, int_factor_wl)
+        if key not in self._matrices:
+            srf, srf_nbands = self.srf.numpy(), self.srf_nbands.numpy()
+            index = {int(w): i for i, w in enumerate(self.wl.cpu().numpy())}
+            matrix = np.zeros((self.n_wl, self.n_wl_sensor))
+            for sensor_band in range(self.n_wl_sensor):
+                for srf_i in range(srf_nbands[sensor_band]):
+                    # wavelength of the srf_i value ([0]) boosted with the int_factor and its weighting factor ([1]);
+                    # wavelengths outside self.wl are skipped
+                    wlambda = int(srf[srf_i, sensor_band, 0] * int_factor_wl)
+                    if wlambda in index:
+                        matrix[index[wlambda], sensor_band] += srf[srf_i, sensor_band, 1]
+            total = matrix.sum(axis=0)
+            valid = total != 0
+            # divide by the sum to get a weighted average
+            matrix[:, valid] /= total[valid]
+            # not an inference tensor, the matrix is shared with later runs that need gradients
+            with torch.inference_mode(False):
+                self._matrices[key] = (torch.from_numpy(matrix).to(device=key[0], dtype=dtype),
+                                       torch.from_numpy(valid).to(device=key[0]))
+        return self._matrices[key]
+
     def run_srf(self, reflectance, int_factor_wl=1000):
         # convert reflectances to new sensor; the function is vectorized and takes arrays of reflectances
-        # dictionary to map wavelengths [nm] to wavebands
-        hash_getwl = dict(zip(self.wl.cpu().numpy(), list(range(self.n_wl))))
-        # prepare array for corrected refs
-        spec_corr = torch.zeros(
-            (reflectance.shape[0], self.n_wl_sensor), device=device)
-
-        # for each band of the target sensor
-        for sensor_band in range(self.n_wl_sensor):
-            # empty the list of wfactors to include in the weighting function
-            wfactor_include = list()
-            # for each srf_value of the band
-            for srf_i in range(self.srf_nbands[sensor_band]):
-                try:
-                    # obtain wavelength of for the band and srf_i value ([0]) and boost with the int_factor
-                    wlambda = int(
-                        self.srf[srf_i][sensor_band][0].item() * int_factor_wl)
-                except ValueError:
-                    print("Error with sensor band {:d} at the srf #{:d}".format(
-                        sensor_band, srf_i))
-                    return
-
-                if wlambda not in self.wl.cpu().numpy():  # this happens when a wavelength is specified
-                    continue                             # in the srf-file outside 400-2500
-
-                # Do the same with the weighting factor for band and srf_i value ([1])
-                wfactor = self.srf[srf_i][sensor_band][1]
-                # add it to the list of wfactors for this sensor band
-                wfactor_include.append(srf_i)
-                # add to the spectral sums for this sensor band
-                spec_corr[:, sensor_band] += reflectance[:,
-                                                         hash_getwl[wlambda]] * wfactor
-
-            # get the total sum for the sensor band
-            sum_wfactor = sum(self.srf[i][sensor_band][1].item()
-                              for i in wfactor_include)
-
-            # try:
-            #     # divide by the sum to get a weighted average
-            #     spec_corr[:, sensor_band] /= sum_wfactor
-            # except ZeroDivisionError:  # this happens when no srf-value can be extracted from the original data
-            #     spec_corr[:, sensor_band] = self.nodat
-
-            if sum_wfactor != 0:
-                # divide by the sum to get a weighted average
-                spec_corr[:, sensor_band] /= sum_wfactor
-            else:
-                # this happens when no srf-value can be extracted from the original data
-                spec_corr[:, sensor_band] = torch.full_like(
-                    spec_corr[:, sensor_band], self.nodat)
-
-        return spec_corr
+        # all bands are computed in one matrix product, bands without weights within self.wl are set to nodat
+        matrix, valid = self.srf_matrix(reflectance.device, reflectance.dtype, int_factor_wl)
+        return torch.where(valid, reflectance @ matrix, self.nodat)
+
+
+class MultiSpec2Sensor:
+    """
+    Conversion of the same spectra to several sensors: the SRF matrices of all sensors are stacked column-wise into
+    one block matrix, so every sensor is obtained from one matrix product. run_srf returns the stacked bands
+    (n, sum of n_wl_sensor), split gives a dictionary sensor -> (n, n_wl_sensor).
+    """
+
+    def __init__(self, nodat, sensors):
+        self.nodat = nodat
+        self.sensors = list(sensors)
+        self.s2s = [Spec2Sensor(nodat=nodat, sensor=sensor) for sensor in self.sensors]
+        self.wl = self.s2s[0].wl
+        self.n_wl = len(self.wl)
+        self._matrices = {}
+
+    def init_sensor(self):
+        if not all(s2s.init_sensor() for s2s in self.s2s):
+            return False
+        self.wl_sensor = torch.cat([s2s.wl_sensor for s2s in self.s2s])
+        self.n_wl_sensor = len(self.wl_sensor)
+        self.sections = [s2s.n_wl_sensor for s2s in self.s2s]
+        return True
+
+    def set_wavelengths(self, wl):
+        for s2s in self.s2s:
+            s2s.set_wavelengths(wl)
+        self.wl = self.s2s[0].wl
+        self.n_wl = len(self.wl)
+        self._matrices = {}
+
+    def srf_wavelengths(self, int_factor_wl=1000):
+        return set().union(*(s2s.srf_wavelengths(int_factor_wl) for s2s in self.s2s))
+
+    def srf_matrix(self, device='cpu', dtype=torch.float32, int_factor_wl=1000):
+        # block matrix (n_wl, sum of n_wl_sensor) and mask of the valid bands of all sensors
+        key = (torch.device(device), dtype, int_factor_wl)
+        if key not in self._matrices:
+            matrices, valid = zip(*(s2s.srf_matrix(device, dtype, int_factor_wl) for s2s in self.s2s))
+            with torch.inference_mode(False):
+                self._matrices[key] = (torch.cat(matrices, dim=1), torch.cat(valid))
+        return self._matrices[key]
+
+    def run_srf(self, reflectance, int_factor_wl=1000):
+        matrix, valid = self.srf_matrix(reflectance.device, reflectance.dtype, int_factor_wl)
+        return torch.where(valid, reflectance @ matrix, self.nodat)
+
+    def split(self, spectra):
+        # stacked bands -> dictionary of the bands of each sensor (views)
+        return dict(zip(self.sensors, torch.split(spectra, self.sections, dim=-1)))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+constants.py - registry of the constant tables of the RTM as tensors
+
+The tables (PROSPECT coefficients, background spectra, LIDF tables) are loaded as numpy arrays once and converted
+to tensors on first request for a (group, device, dtype) combination. The tensors are memoized and shared, so
+models on different devices or with different precision can run side by side without module-level conversion and
+without moving constants in every call:
+
+    t = registry.get('prospectPro', device=N.device, dtype=N.dtype)
+
+The tensors are always created outside of torch.inference_mode: a table created by a first run under inference mode
+would otherwise be an inference tensor, which later runs with gradients cannot save for the backward pass.
+"""
+import threading
+import torch
+
+
+class ConstantRegistry:
+
+    def __init__(self, loader):
+        """
+        loader: function group -> dict of numpy arrays, called once per group
+        """
+        self.loader = loader
+        self._arrays = {}
+        self._tensors = {}
+        self._lock = threading.Lock()
+
+    def arrays(self, group):
+        if group not in self._arrays:
+            with self._lock:
+                if group not in self._arrays:
+                    self._arrays[group] = self.loader(group)
+        return self._arrays[group]
+
+    def get(self, group, device='cpu', dtype=torch.float32, bands=None):
+        """
+        Dictionary of the tables of a group as tensors on device (created on the first call); floating point tables
+        are converted to dtype, integer tables keep their type.
+        bands: tuple of indices along the last (spectral) axis to which the tables are restricted (None: all)
+        """
+        key = (group, torch.device(device), dtype, bands)
+        tensors = self._tensors.get(key)
+        if tensors is None:
+            with torch.inference_mode(False):
+                if bands is None:
+                    tensors = {name: torch.as_tensor(array).to(device=key[1],
+                                                               dtype=dtype if array.dtype.kind == 'f' else None)
+                               for name, array in self.arrays(group).items()}
+                else:
+                    index = torch.tensor(bands, device=key[1])
+                    tensors = {name: t.index_select(-1, index) for name, t in self.get(group, device, dtype).items()}
+            with self._lock:
+                tensors = self._tensors.setdefault(key, tensors)
+        return tensors
+
+    def clear(self, device=None):
+        # frees the tensors of all devices or of one device
+        with self._lock:
+            for key in [k for k in self._tensors if device is None or k[1] == torch.device(device)]:
+                del self._tensors[key]
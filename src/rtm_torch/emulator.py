@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+emulator.py - neural network emulator of the PROSPECT + 4SAIL/INFORM chain
+
+The emulator replaces the physical RTM where speed matters more than exactness (e.g. AE_RTM.decode and
+SrGAN_RTM.RTM_simulation during training). It is trained in three steps:
+
+    paras, spectra = generate_corpus(rtm_paras, 200000, lop='prospectPro', canopy_arch='sail')
+    emulator = RTMEmulator(rtm_paras).init_basis(spectra)
+    fit_emulator(emulator, paras, spectra)
+
+The emulator predicts the coefficients of a PCA basis of the training spectra with a small MLP, which keeps it
+compact and smooth along the spectral axis. It is called like AE_RTM.decode with a dictionary of parameter tensors
+and returns reflectances of shape (n, n_bands). band_error reports the per-band deviation from the physical model;
+an emulator trained on another design than 'uniform' is created as RTMEmulator(rtm_paras, design=design), so that
+band_error samples with the design of its corpus.
+"""
+import math
+import torch
+import torch.nn as nn
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel, broadcast_paras
+from rtm_torch.lut import lut_defaults
+from rtm_torch.sampling import make_sampler
+
+
+def generate_corpus(rtm_paras, num_samples, lop='prospectPro', canopy_arch='sail', sensor='default',
+                    fixed_paras=None, batch_size=2048, seed=0, design='uniform'):
+    """
+    Simulates a training corpus for the emulator with InitModel.
+    The parameters in rtm_paras (dict of {"min", "max"} as in AE_RTM.rtm_paras) are sampled with design (see
+    rtm_torch.sampling.DESIGNS; 'uniform': independent uniform draws), crown diameter and tree height are derived
+    from the crown cover 'fc', all other parameters are kept at lut_defaults(canopy_arch) (or fixed_paras).
+    Returns the sampled parameters (num_samples, len(rtm_paras)) and the spectra (num_samples, n_bands).
+    """
+    model = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor, inference=True)
+    para_names = list(rtm_paras.keys())
+    sampler = make_sampler(design, rtm_paras, num_samples, seed=seed)
+    defaults = lut_defaults(canopy_arch, fixed_paras)
+    paras, spectra = [], []
+    for chunk in sampler.chunks(batch_size):
+        paras.append(torch.stack([chunk[k] for k in para_names], dim=1))
+        para_dict = dict(defaults)
+        para_dict.update({k: v.to(model.device) for k, v in chunk.items()})
+        spectra.append(model.run_model(paras=para_dict).cpu())
+
+    return torch.cat(paras), torch.cat(spectra)
+
+
+class RTMEmulator(nn.Module):
+    """
+    MLP emulator of the RTM reflectance: normalized parameters -> PCA coefficients -> spectrum
+    """
+
+    def __init__(self, rtm_paras, n_bands=2101, n_components=40, hidden_dim=256, n_layers=3, design='uniform'):
+        # design: sampling design of the training corpus (see generate_corpus), band_error samples with it
+        super(RTMEmulator, self).__init__()
+        self.rtm_paras = rtm_paras
+        self.design = design
+        self.para_names = list(rtm_paras.keys())
+        self.n_bands = n_bands
+        self.n_components = n_components
+
+        self.register_buffer('para_min', torch.tensor([rtm_paras[k]['min'] for k in self.para_names]))
+        self.register_buffer('para_max', torch.tensor([rtm_paras[k]['max'] for k in self.para_names]))
+        # PCA basis of the training spectra, set by init_basis
+        self.register_buffer('spec_mean', torch.zeros(n_bands))
+        self.register_buffer('basis', torch.eye(n_components, n_bands))
+        self.register_buffer('coef_std', torch.ones(n_components))
+
+        layers = []
+        in_dim = len(self.para_names)
+        for _ in range(n_layers):
+            layers += [nn.Linear(in_dim, hidden_dim), nn.SiLU()]
+            in_dim = hidden_dim
+        layers.append(nn.Linear(in_dim, n_components))
+        self.net = nn.Sequential(*layers)
+
+    def init_basis(self, spectra):
+        """Fits the PCA basis (mean, components and coefficient scale) to a corpus of spectra"""
+        spectra = spectra.float().to(self.spec_mean.device)
+        mean = spectra.mean(dim=0)
+        _, _, V = torch.pca_lowrank(spectra - mean, q=self.n_components, center=False)
+        self.spec_mean.copy_(mean)
+        self.basis.copy_(V.T)
+        self.coef_std.copy_(((spectra - mean) @ V).std(dim=0) + 1e-8)
+        return self
+
+    def normalize(self, paras):
+        return 2 * (paras - self.para_min) / (self.para_max - self.para_min) - 1
+
+    def forward_tensor(self, paras):
+        # paras: (n, len(para_names)) in physical units, same order as rtm_paras
+        coef = self.net(self.normalize(paras)) * self.coef_std
+        return coef @ self.basis + self.spec_mean
+
+    def forward(self, para_dict):
+        # same call signature as AE_RTM.decode; parameters not emulated are ignored
+        para_dict = broadcast_paras({k: para_dict[k] for k in self.para_names})
+        paras = torch.stack(list(para_dict.values()), dim=1).float().to(self.spec_mean.device)
+        return self.forward_tensor(paras)
+
+    def save(self, path):
+        torch.save({'rtm_paras': self.rtm_paras, 'n_bands': self.n_bands, 'n_components': self.n_components,
+                    'hidden_dim': self.net[0].out_features, 'n_layers': (len(self.net) - 1) // 2,
+                    'design': self.design, 'state_dict': self.state_dict()}, path)
+
+    @classmethod
+    def load(cls, path, map_location=None):
+        map_location = map_location or torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        checkpoint = torch.load(path, map_location=map_location)
+        emulator = cls(checkpoint['rtm_paras'], n_bands=checkpoint['n_bands'],
+                       n_components=checkpoint['n_components'], hidden_dim=checkpoint['hidden_dim'],
+                       n_layers=checkpoint['n_layers'], design=checkpoint.get('design', 'uniform'))
+        emulator.load_state_dict(checkpoint['state_dict'])
+        return emulator.to(map_location)
+
+
+def fit_emulator(emulator, paras, spectra, n_epochs=200, batch_size=1024, lr=1e-3, val_fraction=0.1, seed=None,
+                 verbose=True, device=None):
+    """
+    Fits the emulator to a corpus from generate_corpus with an MSE loss on the spectra, on device (default: the GPU
+    if available). Returns the training history as a list of (epoch, train_rmse, val_rmse).
+    """
+    device = device or torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    generator = torch.Generator().manual_seed(seed) if seed is not None else None
+    emulator = emulator.to(device)
+    perm = torch.randperm(paras.shape[0], generator=generator)
+    n_val = int(paras.shape[0] * val_fraction)
+    val_idx, tr_idx = perm[:n_val], perm[n_val:]
+    x_tr, y_tr = paras[tr_idx].to(device), spectra[tr_idx].to(device)
+    x_val, y_val = paras[val_idx].to(device), spectra[val_idx].to(device)
+
+    optimizer = torch.optim.Adam(emulator.net.parameters(), lr=lr)
+    scheduler = torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=n_epochs)
+    history = []
+    for epoch in range(1, n_epochs + 1):
+        emulator.train()
+        tr_loss = 0.
+        for idx in torch.randperm(x_tr.shape[0], generator=generator).split(batch_size):
+            optimizer.zero_grad()
+            loss = nn.functional.mse_loss(emulator.forward_tensor(x_tr[idx]), y_tr[idx])
+            loss.backward()
+            optimizer.step()
+            tr_loss += loss.item() * len(idx)
+        scheduler.step()
+
+        emulator.eval()
+        with torch.no_grad():
+            val_loss = nn.functional.mse_loss(emulator.forward_tensor(x_val), y_val).item() if n_val else math.nan
+        history.append((epoch, math.sqrt(tr_loss / x_tr.shape[0]), math.sqrt(val_loss)))
+        if verbose and (epoch % 10 == 0 or epoch == 1):
+            print('Epoch {:d}: train RMSE {:.5f}, val RMSE {:.5f}'.format(*history[-1]))
+
+    return history
+
+
+def band_error(emulator, num_samples=2000, lop='prospectPro', canopy_arch='sail', sensor='default',
+               fixed_paras=None, seed=1, design=None):
+    """
+    Per-band deviation of the emulator from the physical model on fresh samples of the emulator's parameter ranges,
+    drawn with design (default: emulator.design, the design of the training corpus). The default seed differs from
+    the one of generate_corpus, so that the samples are not those of the training corpus.
+    Returns a dictionary with the per-band 'rmse', 'mae' and 'max' (each of shape (n_bands,)) and the overall 'rmse_all'.
+    """
+    paras, spectra = generate_corpus(emulator.rtm_paras, num_samples, lop=lop, canopy_arch=canopy_arch,
+                                     sensor=sensor, fixed_paras=fixed_paras, seed=seed,
+                                     design=design or emulator.design)
+    emulator.eval()
+    with torch.no_grad():
+        diff = emulator.forward_tensor(paras.to(emulator.spec_mean.device)).cpu() - spectra
+
+    return {'rmse': diff.pow(2).mean(dim=0).sqrt(),
+            'mae': diff.abs().mean(dim=0),
+            'max': diff.abs().max(dim=0).values,
+            'rmse_all': diff.pow(2).mean().sqrt().item()}
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+lut.py - generation of look-up tables (LUT) of PROSAIL/INFORM spectra
+
+A LUT is a directory with three files:
+    paras.npy      (N, n_paras) float32, the parameters of every LUT member (column names in the manifest)
+    spectra.npy    (N, n_bands) float32, the simulated spectra (1 nm or convolved to a sensor)
+    manifest.json  the configuration, the chunking and the list of finished chunks
+
+N is split into chunks sized to a memory budget and the chunks are simulated in a process pool under
+torch.inference_mode. Parameters and spectra are written straight into memory-mapped .npy files, so a LUT does not
+need to fit into RAM, and an interrupted run continues with the unfinished chunks when started again:
+
+    lut = LUTGenerator('LUT/sail_pro', rtm_paras, 1000000, lop='prospectPro', canopy_arch='sail')
+    lut.run()
+    paras, spectra, manifest = load_lut('LUT/sail_pro')
+
+Grid-style designs (leaf vectors x canopy vectors) are simulated by FactorizedLUTGenerator, which runs the leaf model
+only once per unique leaf vector.
+"""
+import os
+import json
+import math
+import hashlib
+import numpy as np
+import torch
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+from rtm_torch.sampling import DESIGNS, make_sampler
+
+# Parameter defaults for LUT members (values of RTM.para_init for SAIL, see lut_defaults for INFORM)
+LUT_DEFAULTS = {"N": 1.5, "cab": 40, "car": 10, "anth": 2, "cbrown": 0.25, "cw": 0.03, "cm": 0.0115,
+                "cp": 0.0015, "cbc": 0.01, "LAI": 3, "typeLIDF": 1, "LIDF": 5, "hspot": 0.01, "psoil": 0.8,
+                "tts": 30, "tto": 0, "psi": 0, "LAIu": 0.1, "cd": 4.5, "sd": 500, "h": 20}
+# Defaults of RTM.para_init that differ for INFORM
+INFORM_DEFAULTS = {"LAI": 7}
+
+
+def lut_defaults(canopy_arch="sail", fixed_paras=None):
+    """Parameter defaults of RTM.para_init for canopy_arch, updated with fixed_paras"""
+    defaults = dict(LUT_DEFAULTS, **(INFORM_DEFAULTS if canopy_arch == "inform" else {}))
+    defaults.update(fixed_paras or {})
+    return defaults
+
+
+def load_lut(path, mmap_mode='r'):
+    """Returns the memory-mapped parameters and spectra of a LUT and its manifest"""
+    with open(os.path.join(path, 'manifest.json')) as f:
+        manifest = json.load(f)
+    paras = np.load(os.path.join(path, 'paras.npy'), mmap_mode=mmap_mode)
+    spectra = np.load(os.path.join(path, 'spectra.npy'), mmap_mode=mmap_mode)
+    return paras, spectra, manifest
+
+
+# Each worker process holds its own model, created once by _init_worker
+_worker = {}
+
+
+def _init_worker(lop, canopy_arch, sensor, num_threads):
+    torch.set_num_threads(num_threads)
+    _worker['model'] = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor,
+                                 inference=True)
+
+
+def _sample(config, start, stop):
+    # the design (rtm_torch.sampling.DESIGNS) is drawn for the whole LUT and sliced per chunk, one sampler per worker;
+    # a Latin hypercube keeps its strata of the whole LUT
+    key = (config['sampling'], json.dumps(config['rtm_paras']), config['num_samples'], config['seed'])
+    if _worker.get('sampler_key') != key:
+        _worker['sampler'] = make_sampler(config['sampling'], config['rtm_paras'], config['num_samples'],
+                                          seed=config['seed'])
+        _worker['sampler_key'] = key
+    return {k: v.numpy() for k, v in _worker['sampler'].sample(start, stop).items()}
+
+
+def _para_grid(config, start, stop):
+    para_dict = _sample(config, start, stop)
+    para_grid = np.empty((stop - start, len(config['para_names'])), dtype=np.float32)
+    for i, para_name in enumerate(config['para_names']):
+        para_grid[:, i] = para_dict.get(para_name, config['fixed_paras'].get(para_name))
+    return para_grid
+
+
+def _run_chunk(path, config, chunk, start, stop):
+    # sample, simulate and write one chunk
+    para_grid = _para_grid(config, start, stop)
+
+    model = _worker['model']
+    paras = torch.from_numpy(para_grid).to(model.device)
+    # with several sensors their bands side by side, in the order of LUTGenerator.wavelengths
+    spectra = model.run_model(paras={k: paras[:, i] for i, k in enumerate(config['para_names'])}, split=False)
+
+    paras_mm = np.load(os.path.join(path, 'paras.npy'), mmap_mode='r+')
+    spectra_mm = np.load(os.path.join(path, 'spectra.npy'), mmap_mode='r+')
+    paras_mm[start:stop] = para_grid
+    spectra_mm[start:stop] = spectra.cpu().numpy()
+    paras_mm.flush()
+    spectra_mm.flush()
+    del paras_mm, spectra_mm
+    return chunk
+
+
+class LUTGenerator:
+
+    def __init__(self, path, rtm_paras, num_samples, lop="prospectPro", canopy_arch="sail", sensor="default",
+                 fixed_paras=None, sampling="uniform", memory_budget=1024 ** 3, n_workers=None, seed=0):
+        """
+        path:           output directory of the LUT
+        rtm_paras:      dict or path to a json file with {"para": {"min": .., "max": ..}} (rtm_paras.json format)
+        num_samples:    number of LUT members
+        fixed_paras:    values for parameters that are not sampled (defaults: lut_defaults(canopy_arch))
+        sampling:       name of a design in rtm_torch.sampling.DESIGNS
+        memory_budget:  bytes available to the simulation of one chunk, i.e. per worker process
+        n_workers:      number of worker processes (0 runs in the calling process; default: all cores)
+        """
+        if isinstance(rtm_paras, str):
+            with open(rtm_paras) as f:
+                rtm_paras = json.load(f)
+        assert sampling in DESIGNS, "Unknown sampling design {}, choose from {}".format(sampling, list(DESIGNS))
+
+        self.path = path
+        self.n_workers = os.cpu_count() if n_workers is None else n_workers
+        self.model = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor,
+                               inference=True)
+        para_names = self.model.para_names + [k for k in rtm_paras if k not in self.model.para_names]
+        fixed = lut_defaults(canopy_arch, fixed_paras)
+
+        self.config = {'lop': lop, 'canopy_arch': canopy_arch, 'sensor': sensor, 'num_samples': num_samples,
+                       'rtm_paras': rtm_paras, 'fixed_paras': {k: v for k, v in fixed.items() if k not in rtm_paras},
+                       'sampling': sampling, 'seed': seed, 'para_names': para_names,
+                       'chunk_size': self.chunk_size(memory_budget)}
+
+    def chunk_size(self, memory_budget):
+        # the chunking does not depend on the number of workers, so the LUT is reproducible for a given seed
+        return max(1, int(memory_budget // self.model.bytes_per_sample(grad=False)))
+
+    def para_grid(self, start, stop):
+        # parameters (stop - start, n_paras) of the LUT members start..stop
+        return _para_grid(self.config, start, stop)
+
+    def validate_dtype(self, num_samples=256, reference=torch.float64):
+        """
+        Maximum deviation per band of the float32 spectra of the first num_samples LUT members from reference,
+        see InitModel.dtype_deviation
+        """
+        para_grid = torch.from_numpy(self.para_grid(0, min(num_samples, self.config['num_samples'])))
+        paras = {k: para_grid[:, i].to(self.model.device) for i, k in enumerate(self.config['para_names'])}
+        return self.model.dtype_deviation(paras, reference)
+
+    def wavelengths(self):
+        if self.model.s2s == "default":
+            return list(range(400, 2501))
+        return self.model.s2s_I.wl_sensor.cpu().tolist()
+
+    def _write_manifest(self, manifest):
+        # write to a temporary file first so that an interruption never leaves a broken manifest
+        tmp = os.path.join(self.path, 'manifest.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, os.path.join(self.path, 'manifest.json'))
+
+    def _prepare(self):
+        # create the memory maps and the manifest, or load the manifest of an interrupted run
+        manifest_path = os.path.join(self.path, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest['config'] != json.loads(json.dumps(self.config)):
+                raise ValueError("{} contains a LUT with a different configuration".format(self.path))
+            return manifest
+
+        os.makedirs(self.path, exist_ok=True)
+        num_samples = self.config['num_samples']
+        np.lib.format.open_memmap(os.path.join(self.path, 'paras.npy'), mode='w+', dtype=np.float32,
+                                  shape=(num_samples, len(self.config['para_names'])))
+        np.lib.format.open_memmap(os.path.join(self.path, 'spectra.npy'), mode='w+', dtype=np.float32,
+                                  shape=(num_samples, len(self.wavelengths())))
+        manifest = {'config': self.config, 'wavelengths': self.wavelengths(),
+                    'n_chunks': math.ceil(num_samples / self.config['chunk_size']), 'done': []}
+        self._write_manifest(manifest)
+        return manifest
+
+    def run(self, verbose=True):
+        """Simulates all unfinished chunks; returns the manifest"""
+        manifest = self._prepare()
+        chunk_size, num_samples = self.config['chunk_size'], self.config['num_samples']
+        todo = [(c, c * chunk_size, min((c + 1) * chunk_size, num_samples))
+                for c in range(manifest['n_chunks']) if c not in set(manifest['done'])]
+
+        def finished(chunk):
+            manifest['done'].append(chunk)
+            self._write_manifest(manifest)
+            if verbose:
+                print("LUT chunk {:d} done ({:d}/{:d})".format(chunk, len(manifest['done']), manifest['n_chunks']))
+
+        if self.n_workers == 0:
+            _worker['model'] = self.model
+            for task in todo:
+                finished(_run_chunk(self.path, self.config, *task))
+            return manifest
+
+        threads = max(1, os.cpu_count() // self.n_workers)
+        with ProcessPoolExecutor(max_workers=self.n_workers, mp_context=mp.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(self.config['lop'], self.config['canopy_arch'], self.config['sensor'],
+                                           threads)) as pool:
+            futures = [pool.submit(_run_chunk, self.path, self.config, *task) for task in todo]
+            for future in as_completed(futures):
+                finished(future.result())
+
+        return manifest
+
+
+# Parameters of the leaf model; all other parameters belong to the canopy model or the geometry
+LEAF_PARAS = ["N", "cab", "car", "anth", "cbrown", "cw", "cm", "cp", "cbc"]
+
+
+def _digest(arrays):
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(arrays):
+        h.update(name.encode() + np.ascontiguousarray(arrays[name], dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+class FactorizedLUTGenerator(LUTGenerator):
+    """
+    LUT of a grid-style design, in which leaf parameter vectors are combined with canopy parameter vectors: either
+    the Cartesian product (row = leaf index * n_canopy + canopy index) or given pairs of indices. The leaf model runs
+    once per unique leaf vector, its reflectance and transmittance are kept in memory and the canopy model runs on
+    them chunk by chunk. The LUT has the same format as the one of LUTGenerator (see load_lut):
+
+        lut = FactorizedLUTGenerator('LUT/grid', leaf_paras={'cab': cab_grid, 'cw': cw_grid},
+                                     canopy_paras={'LAI': lai_grid, 'tts': tts_grid})
+        lut.run()
+    """
+
+    def __init__(self, path, leaf_paras, canopy_paras, pairs=None, lop="prospectPro", canopy_arch="sail",
+                 sensor="default", fixed_paras=None, memory_budget=1024 ** 3):
+        """
+        leaf_paras:     dict of leaf parameters (names in LEAF_PARAS) -> values, one per leaf vector
+        canopy_paras:   dict of the other parameters -> values, one per canopy vector
+        pairs:          None for the Cartesian product, or (leaf indices, canopy indices) of equal length
+        fixed_paras:    values for parameters in neither dict (defaults: lut_defaults(canopy_arch))
+        """
+        unknown = [k for k in leaf_paras if k not in LEAF_PARAS] + [k for k in canopy_paras if k in LEAF_PARAS]
+        assert not unknown, "Parameters in the wrong group: {}".format(unknown)
+        self.path = path
+        self.n_workers = 0
+        self.model = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor,
+                               inference=True)
+        self.leaf_paras = {k: np.asarray(v, dtype=np.float32) for k, v in leaf_paras.items()}
+        self.canopy_paras = {k: np.asarray(v, dtype=np.float32) for k, v in canopy_paras.items()}
+        n_leaf = len(next(iter(self.leaf_paras.values())))
+        n_canopy = len(next(iter(self.canopy_paras.values())))
+        if pairs is None:
+            self.pairs = None
+            num_samples = n_leaf * n_canopy
+        else:
+            self.pairs = tuple(np.asarray(p, dtype=np.int64) for p in pairs)
+            num_samples = len(self.pairs[0])
+        fixed = lut_defaults(canopy_arch, fixed_paras)
+
+        self.config = {'lop': lop, 'canopy_arch': canopy_arch, 'sensor': sensor, 'num_samples': num_samples,
+                       'design': 'product' if pairs is None else 'paired', 'n_leaf': n_leaf, 'n_canopy': n_canopy,
+                       'design_digest': _digest(dict(self.leaf_paras, **self.canopy_paras,
+                                                     **({} if pairs is None else {'_pairs': np.stack(self.pairs)}))),
+                       'fixed_paras': {k: v for k, v in fixed.items()
+                                       if k not in self.leaf_paras and k not in self.canopy_paras},
+                       'para_names': self.model.para_names, 'chunk_size': self.chunk_size(memory_budget)}
+
+    def indices(self, start, stop):
+        # leaf and canopy index of the LUT rows start..stop
+        rows = np.arange(start, stop)
+        if self.pairs is None:
+            return rows // self.config['n_canopy'], rows % self.config['n_canopy']
+        return self.pairs[0][rows], self.pairs[1][rows]
+
+    def leaf_optics(self):
+        """Leaf model output of the unique leaf vectors and the index of each leaf vector into it"""
+        device = self.model.device
+        fixed = self.config['fixed_paras']
+        leaf = np.stack([self.leaf_paras[k] if k in self.leaf_paras else np.full(self.config['n_leaf'], fixed[k],
+                                                                                  dtype=np.float32)
+                         for k in LEAF_PARAS], axis=1)
+        uniq, inverse = torch.unique(torch.from_numpy(leaf).to(device), dim=0, return_inverse=True)
+        chunk_size = self.config['chunk_size']
+        with torch.inference_mode():
+            optics = torch.cat([self.model.leaf_optics({k: uniq[start:start + chunk_size, i]
+                                                        for i, k in enumerate(LEAF_PARAS)})
+                                for start in range(0, uniq.shape[0], chunk_size)])
+        return optics, inverse
+
+    def para_grid(self, start, stop):
+        leaf_index, canopy_index = self.indices(start, stop)
+        para_grid = np.empty((stop - start, len(self.config['para_names'])), dtype=np.float32)
+        for i, para_name in enumerate(self.config['para_names']):
+            if para_name in self.leaf_paras:
+                para_grid[:, i] = self.leaf_paras[para_name][leaf_index]
+            elif para_name in self.canopy_paras:
+                para_grid[:, i] = self.canopy_paras[para_name][canopy_index]
+            else:
+                para_grid[:, i] = self.config['fixed_paras'][para_name]
+        return para_grid
+
+    def _run_chunk(self, optics, inverse, chunk, start, stop):
+        leaf_index = self.indices(start, stop)[0]
+        para_grid = self.para_grid(start, stop)
+
+        model = self.model
+        paras = torch.from_numpy(para_grid).to(model.device)
+        with torch.inference_mode():
+            leaf = optics[inverse[torch.from_numpy(leaf_index).to(inverse.device)]]
+            # with several sensors the bands are already side by side, as in the LUT of LUTGenerator
+            spectra = model._run_model({k: paras[:, i] for i, k in enumerate(self.config['para_names'])}, leaf)
+
+        paras_mm = np.load(os.path.join(self.path, 'paras.npy'), mmap_mode='r+')
+        spectra_mm = np.load(os.path.join(self.path, 'spectra.npy'), mmap_mode='r+')
+        paras_mm[start:stop] = para_grid
+        spectra_mm[start:stop] = spectra.cpu().numpy()
+        paras_mm.flush()
+        spectra_mm.flush()
+        del paras_mm, spectra_mm
+        return chunk
+
+    def run(self, verbose=True):
+        """Simulates all unfinished chunks in the calling process; returns the manifest"""
+        manifest = self._prepare()
+        chunk_size, num_samples = self.config['chunk_size'], self.config['num_samples']
+        todo = [(c, c * chunk_size, min((c + 1) * chunk_size, num_samples))
+                for c in range(manifest['n_chunks']) if c not in set(manifest['done'])]
+        if not todo:
+            return manifest
+
+        optics, inverse = self.leaf_optics()
+        if verbose:
+            print("Leaf model run for {:d} unique of {:d} leaf vectors".format(optics.shape[0], len(inverse)))
+        for task in todo:
+            manifest['done'].append(self._run_chunk(optics, inverse, *task))
+            self._write_manifest(manifest)
+            if verbose:
+                print("LUT chunk {:d} done ({:d}/{:d})".format(task[0], len(manifest['done']), manifest['n_chunks']))
+        return manifest
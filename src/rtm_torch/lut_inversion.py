@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+lut_inversion.py - trait retrieval by nearest-neighbour search in a LUT of simulated spectra
+
+The LUT spectra are reduced with a PCA (fitted on a random subset) and indexed with a KD-tree or ball-tree.
+Measured spectra are projected into the same space and the traits of the k nearest LUT members are averaged,
+weighted with the inverse distance. The reduced LUT is kept in RAM as float32 and the LUT itself is only read in
+chunks, so LUTs from rtm_torch.lut with millions of members can be indexed on a CPU machine:
+
+    index = LUTIndex(n_components=20).fit_lut('LUT/sail_pro', traits=["cab", "cw", "cm", "LAI"])
+    val_x, val_y = data_prep_db(db_val_lb, ls_tr)
+    preds = index.predict(val_x, k=20)
+"""
+import numpy as np
+import pandas as pd
+from pickle import dump, load
+from sklearn.decomposition import PCA
+from sklearn.neighbors import NearestNeighbors
+
+from rtm_torch.lut import load_lut
+
+# Bands of the measured spectra returned by utils_data.data_prep_db: 400-2450 nm without the water absorption
+# bands removed by feature_preparation
+PREP_BANDS = [wl for wl in range(400, 2451) if not (1351 <= wl < 1431 or 1801 <= wl < 2051)]
+
+
+class LUTIndex:
+
+    def __init__(self, n_components=20, algorithm='kd_tree', leaf_size=40, fit_samples=100000, chunk_size=100000,
+                 n_jobs=-1, seed=0):
+        """
+        n_components:   number of principal components the spectra are reduced to
+        algorithm:      'kd_tree' or 'ball_tree'
+        fit_samples:    number of LUT members used to fit the PCA
+        chunk_size:     number of spectra transformed/queried at once
+        """
+        assert algorithm in ('kd_tree', 'ball_tree')
+        self.n_components = n_components
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.fit_samples = fit_samples
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs
+        self.seed = seed
+
+        self.bands = None
+        self.traits = None
+        self.pca = None
+        self.nn = None
+        self.lut_traits = None
+
+    def fit(self, spectra, paras, wavelengths, para_names, traits=None, bands=PREP_BANDS):
+        """
+        spectra:        (N, n_wl) LUT spectra (array or memory map)
+        paras:          (N, n_paras) LUT parameters with columns para_names
+        wavelengths:    wavelengths of the spectra columns
+        traits:         parameters to retrieve (default: all)
+        bands:          wavelengths used for the search; measured spectra need to contain them
+        """
+        wl_index = {int(wl): i for i, wl in enumerate(wavelengths)}
+        missing = [wl for wl in bands if wl not in wl_index]
+        if missing:
+            raise ValueError("The LUT does not contain the bands {}".format(missing[:10]))
+        self.bands = list(bands)
+        cols = np.array([wl_index[wl] for wl in self.bands])
+        self.traits = list(traits) if traits is not None else list(para_names)
+        self.lut_traits = np.asarray(paras[:, [para_names.index(t) for t in self.traits]], dtype=np.float32)
+
+        n = spectra.shape[0]
+        rng = np.random.default_rng(self.seed)
+        fit_idx = np.sort(rng.choice(n, size=min(n, self.fit_samples), replace=False))
+        self.pca = PCA(n_components=self.n_components, random_state=self.seed)
+        self.pca.fit(np.asarray(spectra[fit_idx][:, cols], dtype=np.float32))
+
+        reduced = np.empty((n, self.n_components), dtype=np.float32)
+        for start in range(0, n, self.chunk_size):
+            chunk = np.asarray(spectra[start:start + self.chunk_size][:, cols], dtype=np.float32)
+            reduced[start:start + self.chunk_size] = self.pca.transform(chunk)
+
+        self.nn = NearestNeighbors(algorithm=self.algorithm, leaf_size=self.leaf_size, n_jobs=self.n_jobs)
+        self.nn.fit(reduced)
+        return self
+
+    def fit_lut(self, path, traits=None, bands=PREP_BANDS):
+        """Builds the index from a LUT directory written by rtm_torch.lut.LUTGenerator"""
+        paras, spectra, manifest = load_lut(path)
+        return self.fit(spectra, paras, manifest['wavelengths'], manifest['config']['para_names'],
+                        traits=traits, bands=bands)
+
+    def transform(self, measured):
+        # measured: DataFrame with wavelength columns (as returned by data_prep_db) or array with self.bands
+        if isinstance(measured, pd.DataFrame):
+            measured = measured.loc[:, self.bands].values
+        return self.pca.transform(np.asarray(measured, dtype=np.float32))
+
+    def query(self, measured, k=10):
+        """Returns distances and LUT indices (n, k) of the k nearest LUT members of each measured spectrum"""
+        reduced = self.transform(measured)
+        dist, ind = [], []
+        for start in range(0, reduced.shape[0], self.chunk_size):
+            d, i = self.nn.kneighbors(reduced[start:start + self.chunk_size], n_neighbors=k)
+            dist.append(d)
+            ind.append(i)
+        return np.concatenate(dist), np.concatenate(ind)
+
+    def predict(self, measured, k=10, weights='distance', return_std=False):
+        """
+        k-weighted trait estimates of the measured spectra as DataFrame (columns: self.traits);
+        weights='distance' uses inverse distance weights, 'uniform' the plain mean of the k neighbours
+        """
+        dist, ind = self.query(measured, k=k)
+        if weights == 'distance':
+            w = 1.0 / (dist + 1e-12)
+        else:
+            w = np.ones_like(dist)
+        w = (w / w.sum(axis=1, keepdims=True))[:, :, None]
+
+        neighbours = self.lut_traits[ind]  # (n, k, n_traits)
+        mean = (w * neighbours).sum(axis=1)
+        index = measured.index if isinstance(measured, pd.DataFrame) else None
+        preds = pd.DataFrame(mean, columns=self.traits, index=index)
+        if return_std:
+            std = np.sqrt((w * (neighbours - mean[:, None, :]) ** 2).sum(axis=1))
+            return preds, pd.DataFrame(std, columns=self.traits, index=index)
+        return preds
+
+    def save(self, path):
+        dump(self, open(path, 'wb'))
+
+    @staticmethod
+    def load(path):
+        return load(open(path, 'rb'))
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+optim_inversion.py - per-spectrum inversion of the RTM by gradient descent
+
+The torch RTM is differentiable, so the parameters of every measured spectrum can be fitted directly. The
+parameters are bounded by sigmoid reparameterization within the rtm_paras ranges:
+
+    para = min + (max - min) * sigmoid(z)
+
+All spectra (times the number of restarts) are optimized together as one batch. Each sample has its own
+convergence state, and samples that converged are removed from the batch, so they do not cost further RTM
+evaluations. The best iterate of every sample is kept, and the restart with the lowest error per spectrum:
+
+    inversion = RTMInversion(rtm_paras, lop='prospectPro', canopy_arch='sail', n_restarts=4)
+    result = inversion.invert(val_x)        # val_x from data_prep_db
+    result['paras'], result['rmse']
+"""
+import math
+import numpy as np
+import pandas as pd
+import torch
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+from rtm_torch.lut import lut_defaults
+from rtm_torch.sampling import derived_paras
+from rtm_torch.lut_inversion import PREP_BANDS
+
+
+class RTMInversion:
+
+    def __init__(self, rtm_paras, lop="prospectPro", canopy_arch="sail", sensor="default", fixed_paras=None,
+                 bands=None, optimizer="adam", lr=0.05, max_iter=500, tol=1e-5, patience=20,
+                 lbfgs_steps=10, n_restarts=4, seed=0):
+        """
+        rtm_paras:      {"para": {"min": .., "max": ..}} of the parameters to retrieve
+        fixed_paras:    values of all other parameters (defaults: rtm_torch.lut.lut_defaults(canopy_arch))
+        bands:          wavelengths used in the fit when the measured spectra are DataFrames; they need to be among the
+                        output bands of the model (default: PREP_BANDS, with a sensor all of its bands)
+        optimizer:      'adam' (per-sample masked Adam) or 'lbfgs' (rounds of lbfgs_steps L-BFGS iterations)
+        tol, patience:  a sample converged when its loss improved by less than tol (relative) for patience steps
+        """
+        assert optimizer in ('adam', 'lbfgs')
+        self.model = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor)
+        self.device = self.model.device
+        self.para_names = list(rtm_paras.keys())
+        self.p_min = torch.tensor([rtm_paras[k]['min'] for k in self.para_names], device=self.device)
+        self.p_max = torch.tensor([rtm_paras[k]['max'] for k in self.para_names], device=self.device)
+        fixed = lut_defaults(canopy_arch, fixed_paras)
+        self.fixed = {k: torch.tensor(float(v), device=self.device) for k, v in fixed.items()
+                      if k not in self.para_names}
+        self.optimizer = optimizer
+        self.lr = lr
+        self.max_iter = max_iter
+        self.tol = tol
+        self.patience = patience
+        self.lbfgs_steps = lbfgs_steps
+        self.n_restarts = n_restarts
+        self.seed = seed
+
+        if sensor == "default":
+            self.wavelengths = list(range(400, 2501))
+        else:
+            self.wavelengths = self.model.s2s_I.wl_sensor.cpu().tolist()
+        if bands is None:
+            bands = PREP_BANDS if sensor == "default" else self.wavelengths
+        wl_index = {int(wl): i for i, wl in enumerate(self.wavelengths)}
+        missing = [wl for wl in bands if int(wl) not in wl_index]
+        if missing:
+            raise ValueError("The model output does not contain the bands {}".format(missing[:10]))
+        self.bands = list(bands)
+        # columns of the model output that are fitted to DataFrames
+        self.band_cols = [wl_index[int(wl)] for wl in self.bands]
+
+    def to_paras(self, z):
+        return self.p_min + (self.p_max - self.p_min) * torch.sigmoid(z)
+
+    def simulate(self, z, cols=None):
+        # spectra of the parameters z at the output columns cols (None: all)
+        paras = self.to_paras(z)
+        para_dict = dict(self.fixed)
+        para_dict.update({k: paras[:, i] for i, k in enumerate(self.para_names)})
+        spectra = self.model.run_model(paras=derived_paras(para_dict))
+        return spectra if cols is None else spectra[:, cols]
+
+    def loss(self, z, target, cols=None):
+        # per-sample mean squared error; failed simulations get an infinite loss
+        loss = (self.simulate(z, cols) - target).pow(2).mean(dim=1)
+        return torch.nan_to_num(loss, nan=math.inf)
+
+    def _prepare_target(self, measured):
+        # target spectra and the output columns they are compared with
+        if isinstance(measured, pd.DataFrame):
+            target, cols = measured.loc[:, self.bands].values, self.band_cols
+        else:
+            target, cols = np.asarray(measured), None
+        return torch.as_tensor(target, dtype=torch.float32, device=self.device), cols
+
+    def _init_z(self, n):
+        # restart 0 starts in the middle of the ranges, the others at uniform random positions
+        generator = torch.Generator().manual_seed(self.seed)
+        u = torch.rand((self.n_restarts, n, len(self.para_names)), generator=generator).clamp(0.02, 0.98)
+        u[0] = 0.5
+        return torch.logit(u).reshape(-1, len(self.para_names)).to(self.device)
+
+    def _update_convergence(self, idx, z, loss, state, steps=1):
+        # z: the iterates of the samples idx at which loss was evaluated
+        improved = loss < state['best'][idx] * (1 - self.tol)
+        state['stall'][idx] = torch.where(improved, torch.zeros_like(state['stall'][idx]),
+                                          state['stall'][idx] + steps)
+        better = loss < state['best'][idx]
+        state['best_z'][idx[better]] = z[better]
+        state['best'][idx] = torch.minimum(state['best'][idx], loss)
+        state['n_iter'][idx] += steps
+        state['active'][idx] = (state['stall'][idx] < self.patience) & (state['n_iter'][idx] < self.max_iter)
+
+    def _run_adam(self, z, target, cols, state, betas=(0.9, 0.999), eps=1e-8):
+        m = torch.zeros_like(z)
+        v = torch.zeros_like(z)
+        while state['active'].any():
+            idx = state['active'].nonzero().squeeze(1)
+            z_a = z[idx].clone().requires_grad_(True)
+            loss = self.loss(z_a, target[idx], cols)
+            grad, = torch.autograd.grad(loss[torch.isfinite(loss)].sum(), z_a)
+            grad = torch.nan_to_num(grad)
+            # Adam with per-sample step counts, only for the active samples
+            t = (state['n_iter'][idx] + 1).unsqueeze(1).float()
+            m[idx] = betas[0] * m[idx] + (1 - betas[0]) * grad
+            v[idx] = betas[1] * v[idx] + (1 - betas[1]) * grad ** 2
+            m_hat = m[idx] / (1 - betas[0] ** t)
+            v_hat = v[idx] / (1 - betas[1] ** t)
+            self._update_convergence(idx, z_a.detach(), loss.detach(), state)
+            z[idx] = z_a.detach() - self.lr * m_hat / (v_hat.sqrt() + eps)
+
+    def _run_lbfgs(self, z, target, cols, state):
+        # L-BFGS shares its line search across the batch, so the active set is only reduced between rounds
+        while state['active'].any():
+            idx = state['active'].nonzero().squeeze(1)
+            z_a = z[idx].clone().requires_grad_(True)
+            optimizer = torch.optim.LBFGS([z_a], lr=1, max_iter=self.lbfgs_steps, line_search_fn='strong_wolfe')
+
+            def closure():
+                optimizer.zero_grad()
+                loss = self.loss(z_a, target[idx], cols)
+                total = loss[torch.isfinite(loss)].sum()
+                total.backward()
+                return total
+
+            optimizer.step(closure)
+            z[idx] = z_a.detach()
+            with torch.no_grad():
+                loss = self.loss(z[idx], target[idx], cols)
+            self._update_convergence(idx, z[idx], loss, state, steps=self.lbfgs_steps)
+
+    def invert(self, measured):
+        """
+        measured: DataFrame with wavelength columns (e.g. from data_prep_db) or array of the model's output bands
+        Returns a dictionary with the retrieved 'paras' (DataFrame), the fit 'rmse' per spectrum, the 'n_iter' and
+        whether the optimization 'converged' before max_iter
+        """
+        target, cols = self._prepare_target(measured)
+        n = target.shape[0]
+        target = target.repeat(self.n_restarts, 1)
+        z = self._init_z(n)
+        m = z.shape[0]
+        state = {'best': torch.full((m,), math.inf, device=self.device),
+                 'stall': torch.zeros(m, dtype=torch.long, device=self.device),
+                 'n_iter': torch.zeros(m, dtype=torch.long, device=self.device),
+                 'active': torch.ones(m, dtype=torch.bool, device=self.device),
+                 'best_z': z.clone()}
+
+        if self.optimizer == 'adam':
+            self._run_adam(z, target, cols, state)
+        else:
+            self._run_lbfgs(z, target, cols, state)
+
+        # pick the restart with the lowest error of its best iterate per spectrum
+        loss = state['best'].view(self.n_restarts, n)
+        best = loss.argmin(dim=0)
+        rows = best * n + torch.arange(n, device=self.device)
+
+        index = measured.index if isinstance(measured, pd.DataFrame) else None
+        paras = self.to_paras(state['best_z'][rows]).cpu().numpy()
+        return {'paras': pd.DataFrame(paras, columns=self.para_names, index=index),
+                'rmse': loss[best, torch.arange(n, device=self.device)].sqrt().cpu().numpy(),
+                'n_iter': state['n_iter'][rows].cpu().numpy(),
+                'converged': (state['n_iter'][rows] < self.max_iter).cpu().numpy()}
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+parallel.py - parallel execution of InitModel on multi-core CPUs
+
+A single process does not scale past a few cores, the element-wise ops over (n, n_wl) tensors are too short for
+torch's intra-op threads. ParallelRTM splits a batch into shards that are simulated by a pool of worker processes.
+Every worker holds its own InitModel (created once, with torch.set_num_threads(threads_per_worker)), and the
+parameters and spectra are exchanged through shared memory, so only the shard bounds are sent between processes:
+
+    with ParallelRTM(lop='prospectPro', canopy_arch='sail', sensor='Sentinel2_Full', n_workers=8) as rtm:
+        spectra = rtm.run(paras)                        # like InitModel.run_model, in the order of the samples
+        for start, stop, spectra in rtm.imap(paras):    # shards as soon as they are finished
+            ...
+
+The spectra are simulated under torch.inference_mode; use InitModel directly when gradients are needed.
+"""
+import os
+import math
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+import numpy as np
+import torch
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel, broadcast_paras
+
+# Each worker process holds its own model, created once by _init_worker
+_worker = {}
+
+
+def _init_worker(config, num_threads):
+    torch.set_num_threads(num_threads)
+    _worker['model'] = InitModel(inference=True, **config)
+
+
+def _run_shard(inputs, outputs, start, stop):
+    # inputs, outputs: (name, shape, dtype) of the shared memory blocks of parameters and spectra
+    model = _worker['model']
+    # the blocks are created and removed by the parent process, the workers only attach to them
+    shm_in, shm_out = SharedMemory(name=inputs[0]), SharedMemory(name=outputs[0])
+    try:
+        para_grid = np.ndarray(inputs[1], dtype=inputs[2], buffer=shm_in.buf)
+        spectra = np.ndarray(outputs[1], dtype=outputs[2], buffer=shm_out.buf)
+        paras = torch.tensor(para_grid[start:stop])
+        # the model runs under torch.inference_mode, with several sensors their bands stay side by side
+        spectra[start:stop] = model.run_model({k: paras[:, i] for i, k in enumerate(model.para_names)},
+                                              split=False).numpy()
+        del para_grid, spectra
+    finally:
+        shm_in.close()
+        shm_out.close()
+    return start, stop
+
+
+class ParallelRTM:
+
+    def __init__(self, lop="prospectPro", canopy_arch="sail", sensor="default", n_workers=None,
+                 threads_per_worker=None, max_memory=None, wavelengths=None, int_boost=1.0, nodat=-999,
+                 dtype=torch.float32):
+        """
+        n_workers:          number of worker processes (default: all cores)
+        threads_per_worker: torch threads of each worker (default: cores / n_workers)
+        max_memory:         bytes available to one shard in a worker, see InitModel
+        The other arguments are passed to the InitModel of every worker.
+        """
+        self.n_workers = os.cpu_count() if n_workers is None else n_workers
+        self.threads_per_worker = threads_per_worker or max(1, os.cpu_count() // self.n_workers)
+        self.config = {'lop': lop, 'canopy_arch': canopy_arch, 's2s': sensor, 'max_memory': max_memory,
+                       'wavelengths': wavelengths, 'int_boost': int_boost, 'nodat': nodat, 'dtype': dtype}
+        # model of the parent process, for the parameter names and the output bands
+        self.model = InitModel(inference=True, **self.config)
+        self.n_bands = len(self.model.wl) if sensor == "default" else self.model.s2s_I.n_wl_sensor
+        self._pool = None
+
+    def start(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=mp.get_context('spawn'),
+                                             initializer=_init_worker,
+                                             initargs=(self.config, self.threads_per_worker))
+        return self
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+    def shard_size(self, n):
+        # a few shards per worker balance the load, InitModel chunks larger shards to max_memory itself
+        return max(1, math.ceil(n / (4 * self.n_workers)))
+
+    def _output(self, spectra):
+        spectra = torch.from_numpy(spectra)
+        return self.model.s2s_I.split(spectra) if self.model.multi_sensor else spectra
+
+    def imap(self, paras, shard_size=None, ordered=False):
+        """
+        Iterates over (start, stop, spectra) of the shards of the batch paras (dictionary as for InitModel.run_model),
+        in the order in which they are finished (ordered=False) or in the order of the samples
+        """
+        self.start()
+        paras = broadcast_paras({k: torch.as_tensor(paras[k]) for k in self.model.para_names})
+        n = next(iter(paras.values())).numel()
+        dtype = np.dtype(str(self.config['dtype']).replace('torch.', ''))
+        shm_in = SharedMemory(create=True, size=max(1, n * len(paras) * dtype.itemsize))
+        shm_out = SharedMemory(create=True, size=max(1, n * self.n_bands * dtype.itemsize))
+        para_grid = np.ndarray((n, len(paras)), dtype=dtype, buffer=shm_in.buf)
+        spectra = np.ndarray((n, self.n_bands), dtype=dtype, buffer=shm_out.buf)
+        futures = []
+        try:
+            for i, k in enumerate(self.model.para_names):
+                para_grid[:, i] = paras[k].detach().cpu().numpy()
+            inputs = (shm_in.name, para_grid.shape, dtype.str)
+            outputs = (shm_out.name, spectra.shape, dtype.str)
+
+            shard_size = shard_size or self.shard_size(n)
+            futures = [self._pool.submit(_run_shard, inputs, outputs, start, min(start + shard_size, n))
+                       for start in range(0, n, shard_size)]
+            for future in (futures if ordered else as_completed(futures)):
+                start, stop = future.result()
+                # copied out of the shared memory, which is released when the iteration ends
+                yield start, stop, self._output(spectra[start:stop].copy())
+        finally:
+            # if the iteration is left early, running shards still write into the blocks
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            del para_grid, spectra
+            shm_in.close()
+            shm_in.unlink()
+            shm_out.close()
+            shm_out.unlink()
+
+    def run(self, paras, shard_size=None):
+        """Spectra of the batch paras, like InitModel.run_model"""
+        shards = list(self.imap(paras, shard_size, ordered=True))
+        if self.model.multi_sensor:
+            return {sensor: torch.cat([s[2][sensor] for s in shards]) for sensor in self.model.s2s_I.sensors}
+        return torch.cat([s[2] for s in shards])
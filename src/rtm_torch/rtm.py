@@ -43,8 +43,18 @@ warnings.filterwarnings('ignore')  # ignore warnings, like ZeroDivision
 
 
 class RTM():
-    def __init__(self):
+    # max_memory: bytes available to one run of the model, larger batches are run in chunks (see InitModel)
+    # wavelengths: spectral window of the model, e.g. (400, 900) or a band mask (see InitModel.spectral_window)
+    # cache: RTMCache memoizing spectra of runs without gradients (see rtm_torch.rtm_cache)
+    # inference: spectra only, run under torch.inference_mode without gradient bookkeeping (see InitModel)
+    # dtype: floating point type of the parameters and the model chain (see InitModel)
+    def __init__(self, max_memory=None, wavelengths=None, cache=None, inference=False, dtype=torch.float32):
         super(RTM, self).__init__()
+        self.max_memory = max_memory
+        self.wavelengths = wavelengths
+        self.cache = cache
+        self.inference = inference
+        self.dtype = dtype
         # store all model choices available for the user
         self.model_choice_init()
         # initialize the model architecture
@@ -94,7 +104,9 @@ class RTM():
         # create new Instance of the RTM
         # TODO scale the real dataset by 10000.0, and use the default value of int_boost 1.0
         return mod.InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999,
-                             int_boost=1.0, s2s=sensor)
+                             int_boost=1.0, s2s=sensor, max_memory=self.max_memory,
+                             wavelengths=self.wavelengths, cache=self.cache, inference=self.inference,
+                             dtype=self.dtype)
 
     def para_init(self):
         # initialize the device
@@ -120,7 +132,7 @@ class RTM():
         # )
 
         # ✅ Fix: Ensure parameters are initialized with gradients enabled
-        self.para_dict = {k: torch.tensor(1.0, dtype=torch.float32, requires_grad=True).to(self.device) ### replaced!!
+        self.para_dict = {k: torch.tensor(1.0, dtype=self.dtype, requires_grad=True).to(self.device) ### replaced!!
                           for k in self.para_names}
 
         # Background Parameters
@@ -181,30 +193,17 @@ class RTM():
         # cd: Crown Diameter (CD)
         self.para_dict["cd"] = 4.5
 
-        # Convert all parameters to tensors
-        self.para_dict = {k: torch.tensor([v], dtype=torch.float32).to(
+        # Convert all parameters to 0-d tensors, they are broadcast to the batch size of the learnable parameters
+        self.para_dict = {k: torch.tensor(v, dtype=self.dtype).to(
             self.device) for k, v in self.para_dict.items()}
 
         # TODO set data_mean to None for future evaluations
         self.data_mean = None
 
-        # Flag to indicate whether the non-learnable parameters have been reset
-        self.reset_non_learnable = True
-
-    # update the parameters of the model
+    # update the parameters of the model; parameters that are not given keep their (scalar) values
     def para_reset(self, **paras):
         self.para_dict.update(paras)
 
-        if self.reset_non_learnable:
-            batch_size = len(list(paras.values())[0])
-            # Reset the non-learnable parameters
-            for k, v in self.para_dict.items():
-                if k not in paras.keys():
-                    # extend the non-learnable parameters to batch size
-                    self.para_dict[k] = torch.full(
-                        (batch_size,), v[0], dtype=torch.float32).to(self.device)
-            self.reset_non_learnable = False
-
     # execute the model to run the radiative transfer model
     def mod_exec(self):
         """
@@ -222,7 +221,8 @@ class RTM():
         # the pytorch model will only run in batch mode
         self.myResult = self.mod_I.initialize_multiple_simple(soil=self.bg_spec,
                                                               **self.para_dict)
-        self.myResult = self.myResult.clone().requires_grad_(True)  # ✅ Preserve gradients ## added
+        if not self.inference:
+            self.myResult = self.myResult.clone().requires_grad_(True)  # ✅ Preserve gradients ## added
 
     # run the model and return the results
     def run(self, **paras):
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+rtm_cache.py - memoization of RTM spectra for inference
+
+Evaluation loops, inversions and LUT lookups often simulate the same (or nearly the same) parameter vectors again.
+RTMCache sits in front of InitModel.run_model: the parameters are quantized to fixed steps, every quantized vector is
+hashed together with the model configuration, and spectra that were simulated before are taken from a bounded LRU
+cache. Only the missing vectors are simulated (at their quantized values, so a cached spectrum does not depend on
+which sample created it). Entries evicted from memory can be spilled to a shelve file on disk:
+
+    cache = RTMCache(max_entries=200000, spill_path='rtm_cache.db')
+    model = InitModel(lop='prospectPro', canopy_arch='sail', cache=cache)
+    with torch.no_grad():
+        spectra = model.run_model(paras)
+    cache.stats()       # {'hits': .., 'disk_hits': .., 'misses': .., 'hit_rate': .., ...}
+
+The cache is bypassed when gradients are required, so training through the RTM is not affected. A background
+spectrum per sample (model.soil of shape (n, n_wl)) is hashed into the key of its sample.
+"""
+import hashlib
+import shelve
+from collections import OrderedDict
+import numpy as np
+import torch
+
+from rtm_torch.Resources.PROSAIL.call_model import batch_size
+
+# Quantization steps of the parameters, i.e. the resolution below which two parameter vectors share a spectrum
+QUANT_STEPS = {"N": 1e-3, "cab": 1e-2, "car": 1e-2, "anth": 1e-3, "cbrown": 1e-3, "cw": 1e-5, "cm": 1e-5,
+               "cp": 1e-6, "cbc": 1e-5, "LAI": 1e-3, "typeLIDF": 1, "LIDF": 1e-2, "hspot": 1e-4, "psoil": 1e-3,
+               "tts": 1e-2, "tto": 1e-2, "psi": 1e-2, "LAIu": 1e-3, "cd": 1e-3, "sd": 1e-1, "h": 1e-2,
+               "soil_index": 1, "soil_weights": 1e-4}
+DEFAULT_STEP = 1e-6
+
+
+class RTMCache:
+
+    def __init__(self, steps=None, max_entries=100000, spill_path=None):
+        """
+        steps:          quantization step per parameter, overrides QUANT_STEPS
+        max_entries:    number of spectra kept in memory
+        spill_path:     shelve file receiving the entries evicted from memory (None: evicted entries are dropped);
+                        the keys contain the model configuration, so the file can be reused by later runs
+        """
+        self.steps = dict(QUANT_STEPS, **(steps or {}))
+        self.max_entries = max_entries
+        self.spill_path = spill_path
+        self._memory = OrderedDict()
+        self._disk = shelve.open(spill_path) if spill_path is not None else None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses, 'bypassed': self.bypassed,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'entries': len(self._memory), 'spilled': len(self._disk) if self._disk is not None else 0}
+
+    def clear(self):
+        self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+        self.reset_stats()
+
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def _prefix(self, model, names, batched_soil=False):
+        # everything besides the parameters that changes the spectra; a per-sample soil goes into the row keys
+        config = repr((model.lop, str(model.canopy_arch), model.s2s, model.bands, float(model.int_boost), names,
+                       str(model.dtype), batched_soil))
+        soil = model.soil.detach().cpu().numpy().tobytes() if isinstance(model.soil, torch.Tensor) and \
+            not batched_soil else b''
+        library = model.soil_library.spectra.tobytes() if model.soil_library is not None else b''
+        return hashlib.blake2b(config.encode() + soil + library, digest_size=16).digest()
+
+    def _get(self, key):
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self._disk is not None:
+            value = self._disk.get(key.hex())
+            if value is not None:
+                self._put(key, value)
+                self.disk_hits += 1
+                return value
+        return None
+
+    def _put(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            old_key, old_value = self._memory.popitem(last=False)
+            if self._disk is not None:
+                self._disk[old_key.hex()] = old_value
+
+    def run(self, model, paras):
+        """Spectra of the parameter dictionary paras, simulated by model (an InitModel) where not cached"""
+        names = sorted(paras)
+        device = paras[names[0]].device
+        n = batch_size(paras)
+        # one column per parameter, parameters with a second axis (soil_weights) get one column per entry
+        columns = []
+        matrices = {k for k in names if paras[k].dim() == 2}
+        for k in names:
+            value = paras[k].detach().cpu().numpy().astype(np.float64)
+            value = value.reshape(n, -1) if value.ndim and value.shape[0] == n else value.reshape(1, -1)
+            columns.append(np.broadcast_to(value, (n, value.shape[1])))
+        widths = [c.shape[1] for c in columns]
+        x = np.concatenate(columns, axis=1)
+        steps = np.concatenate([np.full(w, self.steps.get(k, DEFAULT_STEP)) for k, w in zip(names, widths)])
+        q = np.round(x / steps).astype(np.int64)
+        # a background spectrum per sample (model.soil of shape (n, n_wl)) is part of the key of its row
+        batched_soil = model.batched_soil(n)
+        soil = model.soil.detach().cpu().numpy() if batched_soil else None
+        prefix = self._prefix(model, names, batched_soil)
+        keys = [hashlib.blake2b(prefix + row.tobytes() + (soil[i].tobytes() if batched_soil else b''),
+                                digest_size=16).digest() for i, row in enumerate(q)]
+
+        spectra = [None] * n
+        missing = OrderedDict()  # key -> rows of the batch
+        for i, key in enumerate(keys):
+            if key in missing:
+                missing[key].append(i)
+                continue
+            value = self._get(key)
+            if value is None:
+                missing[key] = [i]
+            else:
+                spectra[i] = value
+        # every missing vector is simulated once, its duplicates in the batch reuse the result
+        self.misses += len(missing)
+        self.hits += sum(len(rows) - 1 for rows in missing.values())
+
+        if missing:
+            first = [rows[0] for rows in missing.values()]
+            # cast to the dtype of the model by InitModel
+            values = q[first] * steps
+            values = np.split(values, np.cumsum(widths)[:-1], axis=1)
+            # parameters with a second axis keep it, also with one entry (soil_weights of a single-soil library)
+            sub = {k: torch.from_numpy(v if k in matrices else v[:, 0]).to(device) for k, v in zip(names, values)}
+            if batched_soil:
+                # the soil rows of the simulated samples, InitModel takes them instead of model.soil
+                sub['soil'] = torch.from_numpy(soil[first]).to(device)
+            with torch.no_grad():
+                result = model.run_chunked(sub, grad=False).cpu().numpy()
+            for (key, rows), value in zip(missing.items(), result):
+                self._put(key, value)
+                for i in rows:
+                    spectra[i] = value
+
+        return torch.from_numpy(np.stack(spectra)).to(device)
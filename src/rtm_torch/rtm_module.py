@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+rtm_module.py - the complete RTM chain (PROSPECT -> SAIL/INFORM -> sensor) as one exportable nn.Module
+
+RTMModule fixes the leaf model, canopy model, sensor and leaf angle distribution type at construction and maps a
+parameter matrix to spectra in one call. The spectral response functions are applied as one dense matrix (see
+Spec2Sensor.srf_matrix), the geometry cache of SAIL is bypassed and E1 is evaluated in pure torch while the
+module is traced or compiled, so the chain can be exported with TorchScript or optimized with torch.compile:
+
+    module = RTMModule(lop='prospectPro', canopy_arch='sail', sensor='Sentinel2_Full')
+    module.export('rtm_sail_s2.pt')                  # TorchScript artifact, includes all tables
+    rtm, config = load_rtm_module('rtm_sail_s2.pt')  # no rtm_torch classes needed
+    spectra = rtm(paras)                             # paras: (n, len(config['para_names']))
+
+    fast = torch.compile(module, dynamic=True)
+
+check_parity compares an exported or compiled module with the eager InitModel.run_model.
+"""
+import json
+import numpy as np
+import torch
+import torch.nn as nn
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+from rtm_torch.lut import LUT_DEFAULTS, lut_defaults
+from rtm_torch.sampling import make_sampler
+
+CONFIG_FILE = 'rtm_config.json'
+
+
+class RTMModule(nn.Module):
+
+    def __init__(self, lop="prospectPro", canopy_arch="sail", sensor="default", type_lidf=LUT_DEFAULTS["typeLIDF"],
+                 int_boost=1.0, nodat=-999, wavelengths=None):
+        """
+        type_lidf:      leaf angle distribution of all samples (1: beta, 2: ellipsoidal), the typeLIDF column of
+                        the inputs is ignored
+        wavelengths:    spectral window of the leaf and canopy model, see InitModel.spectral_window
+        """
+        super(RTMModule, self).__init__()
+        # the spectra are returned without the gradient-preserving clones, autograd still works through the chain
+        self.model = InitModel(lop=lop, canopy_arch=canopy_arch, int_boost=int_boost, nodat=nodat, s2s=sensor,
+                               wavelengths=wavelengths, inference=True)
+        self.para_names = list(self.model.para_names)
+        self.type_lidf = type_lidf
+        self.nodat = nodat
+        self.config = {'lop': lop, 'canopy_arch': canopy_arch, 'sensor': sensor, 'type_lidf': type_lidf,
+                       'int_boost': int_boost, 'nodat': nodat, 'para_names': self.para_names,
+                       'window': None if self.model.bands is None else self.model.wl.tolist(),
+                       'wavelengths': self.wavelengths()}
+
+        if sensor != "default":
+            srf, valid = self.model.s2s_I.srf_matrix()
+            self.register_buffer('srf', srf)
+            self.register_buffer('srf_valid', valid)
+        else:
+            self.srf = None
+
+    def wavelengths(self):
+        # wavelengths [nm] of the output bands
+        if self.model.s2s == "default":
+            return self.model.wl.tolist()
+        return self.model.s2s_I.wl_sensor.tolist()
+
+    def forward(self, paras):
+        # paras: (n, len(self.para_names)) in the order of self.para_names
+        para_dict = {k: paras[:, i] for i, k in enumerate(self.para_names)}
+        para_dict["typeLIDF"] = torch.full_like(paras[:, 0], self.type_lidf)
+        result = self.model.simulate(para_dict)
+        if self.srf is None:
+            return result
+        return torch.where(self.srf_valid, result @ self.srf.to(result.dtype), self.nodat)
+
+    def example_input(self, batch_size=2):
+        # parameter matrix at the defaults of the LUT
+        defaults = lut_defaults(self.config['canopy_arch'])
+        values = [defaults[k] for k in self.para_names]
+        values[self.para_names.index("typeLIDF")] = self.type_lidf
+        device = self.srf.device if self.srf is not None else torch.device('cpu')
+        return torch.tensor(values, dtype=torch.float32, device=device).expand(batch_size, -1).clone()
+
+    def trace(self, batch_size=2):
+        # the batch size of the trace needs to be > 1, otherwise single-element parameters are broadcast in the trace
+        return torch.jit.trace(self.eval(), self.example_input(max(2, batch_size)), check_trace=False)
+
+    def export(self, path, batch_size=2):
+        """Saves the traced chain as TorchScript to path, with the configuration as extra file"""
+        traced = self.trace(batch_size)
+        torch.jit.save(traced, path, _extra_files={CONFIG_FILE: json.dumps(self.config)})
+        return traced
+
+
+def load_rtm_module(path, map_location=None):
+    """Loads a module exported by RTMModule.export; returns the module and its configuration"""
+    extra_files = {CONFIG_FILE: ''}
+    module = torch.jit.load(path, map_location=map_location, _extra_files=extra_files)
+    return module, json.loads(extra_files[CONFIG_FILE])
+
+
+def check_parity(module, config, rtm_paras, num_samples=64, seed=0, fixed_paras=None):
+    """
+    Maximum absolute and relative deviation of module (exported, traced or compiled RTMModule with configuration
+    config) from the eager InitModel.run_model for num_samples parameter vectors sampled from rtm_paras
+    (rtm_paras.json format); the other parameters are kept at lut_defaults or fixed_paras
+    """
+    sampled = {k: v.numpy() for k, v in make_sampler('uniform', rtm_paras, num_samples, seed=seed).sample().items()}
+    fixed = dict(lut_defaults(config['canopy_arch'], fixed_paras), typeLIDF=config['type_lidf'])
+    paras = torch.tensor(np.stack([np.broadcast_to(sampled.get(k, fixed[k]), num_samples)
+                                   for k in config['para_names']], axis=1), dtype=torch.float32)
+
+    eager = InitModel(lop=config['lop'], canopy_arch=config['canopy_arch'], int_boost=config['int_boost'],
+                      nodat=config['nodat'], s2s=config['sensor'], wavelengths=config['window'], inference=True)
+    # with several sensors their bands side by side, as returned by RTMModule
+    reference = eager.run_model({k: paras[:, i] for i, k in enumerate(config['para_names'])}, split=False)
+    with torch.no_grad():
+        result = module(paras)
+    deviation = (result - reference).abs()
+    return {'max_abs': deviation.max().item(),
+            'max_rel': (deviation / reference.abs().clamp(min=1e-6)).max().item()}
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+sampling.py - sampling designs of the RTM parameter space
+
+Independent uniform draws (GAN.utils_gans.para_sampling) leave gaps and clusters in the
+parameter space; the space-filling designs below cover it more evenly with the same number of RTM runs:
+
+    'uniform'       independent uniform draws
+    'lhs'           Latin hypercube: every parameter range is split into num_samples strata with one sample each
+    'sobol'         scrambled Sobol sequence (low discrepancy; num_samples should be a power of 2)
+    'truncnorm'     independent draws from normal distributions truncated to the parameter ranges
+
+A sampler is built for the whole design (num_samples members) and returns any slice of it as a dictionary of
+tensors, including the crown diameter 'cd' and tree height 'h' derived from the crown cover 'fc'. The slices do not
+depend on each other, so a design can be streamed in chunks or split between processes:
+
+    sampler = make_sampler('lhs', rtm_paras, 1000000, seed=0)
+    for para_dict in sampler.chunks(10000):
+        spectra = model.run_model(dict(fixed, **para_dict))
+
+The ranges are given in the rtm_paras.json format; for 'truncnorm' an entry can also contain "mean" and "std"
+(defaults: center of the range and a quarter of its width).
+"""
+import math
+import numpy as np
+import torch
+
+
+def derived_paras(para_dict):
+    # crown diameter and tree height from the crown cover 'fc' (stand density SD = 500 trees/ha)
+    if 'fc' in para_dict:
+        SD = 500
+        para_dict['cd'] = torch.sqrt((para_dict['fc'] * 10000) / (math.pi * SD)) * 2
+        para_dict['h'] = torch.exp(2.117 + 0.507 * torch.log(para_dict['cd']))
+    return para_dict
+
+
+# Random draws are made in blocks of BLOCK_SIZE members, so a design does not depend on the chunk size
+BLOCK_SIZE = 4096
+
+
+def _generator(seed, *key):
+    # independent random stream for (seed, key)
+    state = np.random.SeedSequence([seed, *key]).generate_state(2, dtype=np.uint32)
+    return torch.Generator().manual_seed(int(state[0]) << 32 | int(state[1]))
+
+
+class Sampler:
+    """Independent uniform draws; the other designs override unit() and/or transform()"""
+
+    def __init__(self, rtm_paras, num_samples, seed=0, dtype=torch.float32):
+        self.names = list(rtm_paras)
+        self.rtm_paras = rtm_paras
+        self.num_samples = num_samples
+        self.seed = seed
+        self.dtype = dtype
+        self.p_min = torch.tensor([rtm_paras[k]['min'] for k in self.names], dtype=torch.float64)
+        self.p_max = torch.tensor([rtm_paras[k]['max'] for k in self.names], dtype=torch.float64)
+
+    def unit(self, start, stop):
+        # members start..stop of the design in the unit hypercube, (stop - start, n_paras) float64
+        first, last = start // BLOCK_SIZE, (stop - 1) // BLOCK_SIZE
+        blocks = [torch.rand((BLOCK_SIZE, len(self.names)), generator=_generator(self.seed, 0, block),
+                             dtype=torch.float64) for block in range(first, last + 1)]
+        return torch.cat(blocks)[start - first * BLOCK_SIZE:stop - first * BLOCK_SIZE]
+
+    def transform(self, u):
+        # unit hypercube -> parameter ranges
+        return self.p_min + u * (self.p_max - self.p_min)
+
+    def sample(self, start=0, stop=None):
+        """Parameter dictionary of the members start..stop of the design, with the derived parameters"""
+        stop = self.num_samples if stop is None else min(stop, self.num_samples)
+        x = self.transform(self.unit(start, stop)).to(self.dtype)
+        return derived_paras({k: x[:, i] for i, k in enumerate(self.names)})
+
+    def chunks(self, chunk_size):
+        """Iterates over the design in chunks of chunk_size members"""
+        for start in range(0, self.num_samples, chunk_size):
+            yield self.sample(start, start + chunk_size)
+
+
+class LatinHypercubeSampler(Sampler):
+
+    def __init__(self, rtm_paras, num_samples, seed=0, dtype=torch.float32):
+        super(LatinHypercubeSampler, self).__init__(rtm_paras, num_samples, seed, dtype)
+        self._strata = None
+
+    def strata(self):
+        # stratum of every member per parameter, one random permutation of range(num_samples) per parameter
+        if self._strata is None:
+            self._strata = torch.stack([torch.randperm(self.num_samples, generator=_generator(self.seed, 1, i))
+                                        for i in range(len(self.names))], dim=1)
+        return self._strata
+
+    def unit(self, start, stop):
+        # random position within the stratum
+        jitter = super(LatinHypercubeSampler, self).unit(start, stop)
+        return (self.strata()[start:stop] + jitter) / self.num_samples
+
+
+class SobolSampler(Sampler):
+
+    def unit(self, start, stop):
+        engine = torch.quasirandom.SobolEngine(dimension=len(self.names), scramble=True, seed=self.seed)
+        engine.fast_forward(start)
+        return engine.draw(stop - start, dtype=torch.float64)
+
+
+class TruncatedNormalSampler(Sampler):
+
+    def __init__(self, rtm_paras, num_samples, seed=0, dtype=torch.float32):
+        super(TruncatedNormalSampler, self).__init__(rtm_paras, num_samples, seed, dtype)
+        self.mean = torch.tensor([rtm_paras[k].get('mean', (rtm_paras[k]['min'] + rtm_paras[k]['max']) / 2)
+                                  for k in self.names], dtype=torch.float64)
+        self.std = torch.tensor([rtm_paras[k].get('std', (rtm_paras[k]['max'] - rtm_paras[k]['min']) / 4)
+                                 for k in self.names], dtype=torch.float64)
+
+    def transform(self, u):
+        # inverse CDF of the truncated normal distribution
+        cdf_min = torch.special.ndtr((self.p_min - self.mean) / self.std)
+        cdf_max = torch.special.ndtr((self.p_max - self.mean) / self.std)
+        x = self.mean + self.std * torch.special.ndtri(cdf_min + u * (cdf_max - cdf_min))
+        return torch.minimum(torch.maximum(x, self.p_min), self.p_max)
+
+
+DESIGNS = {'uniform': Sampler, 'lhs': LatinHypercubeSampler, 'sobol': SobolSampler,
+           'truncnorm': TruncatedNormalSampler}
+
+
+def make_sampler(design, rtm_paras, num_samples, seed=0, dtype=torch.float32):
+    assert design in DESIGNS, "Unknown sampling design {}, choose from {}".format(design, list(DESIGNS))
+    return DESIGNS[design](rtm_paras, num_samples, seed=seed, dtype=dtype)
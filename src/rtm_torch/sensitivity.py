@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+sensitivity.py - variance-based global sensitivity analysis (Sobol indices) of the RTM per band
+
+The first-order index S1 of a parameter is the share of the variance of a band that the parameter explains on its
+own, the total-order index ST includes all its interactions with the other parameters. Both are estimated with the
+Saltelli scheme: two independent sample matrices A and B (scrambled Sobol sequence over the ranges of rtm_paras)
+and, for every parameter i, the matrix AB_i (A with column i taken from B), i.e. num_samples * (n_paras + 2) RTM
+runs. The RTM runs are chunked to max_memory by InitModel, the estimators are evaluated for all bands at once:
+
+    result = sobol_indices(rtm_paras, 1024, lop='prospectPro', canopy_arch='sail', sensor='Sentinel2_Full')
+    result['S1'], result['ST']                  # (n_paras, n_bands), rows in the order of result['names']
+    result['S1_conf'], result['ST_conf']        # (2, n_paras, n_bands) bootstrap confidence intervals
+
+The bootstrap resamples are drawn as counts per sample, so every resample is one weighted mean, and all resamples
+are computed together as matrix products.
+"""
+import torch
+
+from rtm_torch.Resources.PROSAIL.call_model import InitModel
+from rtm_torch.lut import lut_defaults
+from rtm_torch.sampling import derived_paras
+
+
+def saltelli_matrices(rtm_paras, num_samples, seed=0):
+    """
+    Sample matrices A and B (num_samples, n_paras) of the parameters in rtm_paras (rtm_paras.json format), scaled
+    to their ranges; num_samples should be a power of 2 to keep the balance of the Sobol sequence
+    """
+    names = list(rtm_paras)
+    engine = torch.quasirandom.SobolEngine(dimension=2 * len(names), scramble=True, seed=seed)
+    u = engine.draw(num_samples, dtype=torch.float64)
+    p_min = torch.tensor([rtm_paras[k]['min'] for k in names], dtype=torch.float64)
+    p_max = torch.tensor([rtm_paras[k]['max'] for k in names], dtype=torch.float64)
+    a = p_min + u[:, :len(names)] * (p_max - p_min)
+    b = p_min + u[:, len(names):] * (p_max - p_min)
+    return a, b
+
+
+def model_paras(x, names, fixed_paras):
+    # parameter dictionary of InitModel for the sample matrix x with columns names, crown diameter and tree height
+    # are derived from the crown cover 'fc'
+    paras = {k: torch.tensor(v, dtype=torch.float32) for k, v in fixed_paras.items() if k not in names}
+    paras.update({k: x[:, i].float() for i, k in enumerate(names)})
+    return derived_paras(paras)
+
+
+def evaluate(model, x, names, fixed_paras):
+    spectra = model.run_model(model_paras(x, names, fixed_paras))
+    if model.multi_sensor:
+        spectra = torch.cat(list(spectra.values()), dim=1)
+    return spectra.double()
+
+
+def _estimate(f_a, f_b, f_ab, weights):
+    """
+    First- and total-order indices (Saltelli 2010 and Jansen estimators) for every row of weights (n_sets, n) of
+    sample counts, vectorized over the parameters and bands:
+    f_a, f_b (n, n_bands), f_ab (n_paras, n, n_bands) -> S1, ST (n_sets, n_paras, n_bands)
+    """
+    n = weights.sum(dim=1)[:, None]
+    mean = (weights @ f_a + weights @ f_b) / (2 * n)
+    var = (weights @ f_a ** 2 + weights @ f_b ** 2) / (2 * n) - mean ** 2
+    # bands without variance (e.g. nodat bands of a sensor) get NaN indices
+    var = torch.where(var > 0, var, torch.nan)[:, None]
+    # weights @ (n_paras, n, n_bands) -> (n_paras, n_sets, n_bands)
+    s1 = torch.matmul(weights, f_b * (f_ab - f_a)).transpose(0, 1) / n[:, None] / var
+    st = 0.5 * torch.matmul(weights, (f_a - f_ab) ** 2).transpose(0, 1) / n[:, None] / var
+    return s1, st
+
+
+def sobol_indices(rtm_paras, num_samples=1024, lop="prospectPro", canopy_arch="sail", sensor="default",
+                  fixed_paras=None, max_memory=1024 ** 3, n_bootstrap=100, confidence=0.95, seed=0):
+    """
+    Sobol indices of the parameters in rtm_paras for every band of the RTM output.
+    fixed_paras:    values for parameters that are not varied (defaults: lut_defaults(canopy_arch))
+    max_memory:     bytes available to one RTM run, larger sample matrices are simulated in chunks
+    n_bootstrap:    number of bootstrap resamples for the confidence intervals (0: no intervals)
+    Returns a dictionary with 'names', 'wavelengths', 'S1', 'ST' (n_paras, n_bands) and, with n_bootstrap > 0,
+    'S1_conf' and 'ST_conf' (2, n_paras, n_bands) with the lower and upper bound of the interval.
+    """
+    model = InitModel(lop=lop, canopy_arch=canopy_arch, nodat=-999, int_boost=1.0, s2s=sensor,
+                      max_memory=max_memory, inference=True)
+    names = list(rtm_paras)
+    fixed = lut_defaults(canopy_arch, fixed_paras)
+    a, b = saltelli_matrices(rtm_paras, num_samples, seed)
+
+    f_a = evaluate(model, a, names, fixed)
+    f_b = evaluate(model, b, names, fixed)
+    f_ab = torch.empty((len(names),) + f_a.shape, dtype=f_a.dtype)
+    for i in range(len(names)):
+        ab = a.clone()
+        ab[:, i] = b[:, i]
+        f_ab[i] = evaluate(model, ab, names, fixed)
+
+    s1, st = _estimate(f_a, f_b, f_ab, torch.ones((1, num_samples), dtype=f_a.dtype))
+    if model.s2s == "default":
+        wavelengths = model.wl.tolist()
+    else:
+        wavelengths = model.s2s_I.wl_sensor.tolist()
+    result = {'names': names, 'wavelengths': wavelengths, 'S1': s1[0].float(), 'ST': st[0].float()}
+
+    if n_bootstrap > 0:
+        generator = torch.Generator().manual_seed(seed)
+        samples = torch.randint(num_samples, (n_bootstrap, num_samples), generator=generator)
+        counts = torch.zeros((n_bootstrap, num_samples), dtype=f_a.dtype)
+        counts.scatter_add_(1, samples, torch.ones_like(counts))
+        s1_boot, st_boot = _estimate(f_a, f_b, f_ab, counts)
+        q = torch.tensor([(1 - confidence) / 2, (1 + confidence) / 2], dtype=f_a.dtype)
+        result['S1_conf'] = torch.nanquantile(s1_boot, q, dim=0).float()
+        result['ST_conf'] = torch.nanquantile(st_boot, q, dim=0).float()
+
+    return result